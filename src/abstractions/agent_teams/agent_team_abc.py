@@ -13,3 +13,15 @@ class AgentTeamABC(ABC):
     @abstractmethod
     def writer_node(self, **kwargs):
         pass
+
+    @abstractmethod
+    async def ateam_supervisor_node(self, **kwargs):
+        pass
+
+    @abstractmethod
+    async def aevaluator_node(self, **kwargs):
+        pass
+
+    @abstractmethod
+    async def awriter_node(self, **kwargs):
+        pass
@@ -1,4 +1,5 @@
 import os
+from pathlib import Path
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
@@ -17,4 +18,38 @@ ECC_COLLECTION = os.getenv("ECC_COLLECTION")
 MYSQL_USERNAME = os.getenv('MYSQL_USER')
 MYSQL_PASSWORD = os.getenv('MYSQL_PASS')
 MYSQL_HOST = os.getenv('MYSQL_HOST')
-MYSQL_PORT = os.getenv('MYSQL_PORT')
\ No newline at end of file
+MYSQL_PORT = os.getenv('MYSQL_PORT')
+
+## Local data cache
+PROJECT_DIR = Path(__file__).resolve().parents[1]
+CACHE_DIR = Path(os.getenv('FDATA_CACHE_DIR', PROJECT_DIR / 'data' / 'cache'))
+FDATA_DIR = Path(os.getenv('FDATA_DIR', PROJECT_DIR / 'data' / 'fdata')) # preprocessed data, e.g. 10K_Items_{ticker}.json
+SEC_RATE_LIMIT = float(os.getenv('SEC_RATE_LIMIT', 10)) # SEC EDGAR fair access: max 10 requests / second
+YFINANCE_OFFLINE = os.getenv('YFINANCE_OFFLINE', 'false').lower() in ('1', 'true', 'yes')
+YAHOO_RATE_LIMIT = float(os.getenv('YAHOO_RATE_LIMIT', 2)) # requests / second, shared by every Yahoo call of the process
+
+## Shared FMP client
+FMP_RATE_LIMIT = float(os.getenv('FMP_RATE_LIMIT', 5)) # requests / second, FMP starter plan: 300 / minute
+FMP_MAX_CONNECTIONS = int(os.getenv('FMP_MAX_CONNECTIONS', 10))
+FMP_TIMEOUT = float(os.getenv('FMP_TIMEOUT', 30))
+
+## Incremental report regeneration: teams whose input data is unchanged reuse their last written section
+REPORT_INCREMENTAL = os.getenv('REPORT_INCREMENTAL', 'true').lower() in ('1', 'true', 'yes')
+REPORT_SECTION_CACHE_DIR = Path(os.getenv('REPORT_SECTION_CACHE_DIR', CACHE_DIR / 'sections'))
+
+## LLM response cache (development reruns)
+LLM_CACHE = os.getenv('LLM_CACHE', 'false').lower() in ('1', 'true', 'yes')
+LLM_CACHE_PATH = Path(os.getenv('LLM_CACHE_PATH', CACHE_DIR / 'llm' / 'llm_cache.sqlite'))
+LLM_CACHE_MAX_ENTRIES = int(os.getenv('LLM_CACHE_MAX_ENTRIES', 10000))
+
+## Shared LLM HTTP clients
+LLM_HTTP2 = os.getenv('LLM_HTTP2', 'true').lower() in ('1', 'true', 'yes')
+LLM_MAX_CONNECTIONS = int(os.getenv('LLM_MAX_CONNECTIONS', 20))
+LLM_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv('LLM_MAX_KEEPALIVE_CONNECTIONS', 10))
+LLM_KEEPALIVE_EXPIRY = float(os.getenv('LLM_KEEPALIVE_EXPIRY', 60))
+LLM_TIMEOUT = float(os.getenv('LLM_TIMEOUT', 120))
+LLM_RATE_LIMIT = float(os.getenv('LLM_RATE_LIMIT', 0)) # requests / second shared by every chat model of the process, 0 for no limit
+
+## Batch report runs
+REPORT_OUTPUT_DIR = Path(os.getenv('REPORT_OUTPUT_DIR', PROJECT_DIR / 'data' / 'reports'))
+PREFETCH_MAX_AGE = float(os.getenv('PREFETCH_MAX_AGE', 12 * 3600)) # seconds a prefetched transcript / competitors file is read before the upstream source again
@@ -1,15 +1,36 @@
 from src.config import MONGODB_URI, DB, ECC_COLLECTION
 from pymongo import MongoClient
+from typing import Dict, List, Optional, Set, Tuple
 import os
+import threading
 from dotenv import load_dotenv, find_dotenv
 _ = load_dotenv(find_dotenv())
 
 class MongoDBHandler:
+    """
+    One MongoClient (and its connection pool) per URI for the whole process, instead of one per handler.
+    """
 
-    def __init__(self):
+    _clients: Dict[str, MongoClient] = {}
+    _indexed: Set[Tuple[str, str, str]] = set()
+    _lock = threading.Lock()
+
+    def __init__(self, uri: Optional[str] = None, client: Optional[MongoClient] = None):
+        """
+        Parameters:
+        uri (str): MongoDB URI, defaults to MONGODB_URI.
+        client (MongoClient): Client to use instead of the shared one (e.g. a mongomock client).
+        """
         super().__init__()
-        self.DB_URI = MONGODB_URI
-        self.client = MongoClient(self.DB_URI)
+        self.DB_URI = uri or MONGODB_URI
+        self.client = client if client is not None else self._get_client(self.DB_URI)
+
+    @classmethod
+    def _get_client(cls, uri: str) -> MongoClient:
+        with cls._lock:
+            if uri not in cls._clients:
+                cls._clients[uri] = MongoClient(uri)
+            return cls._clients[uri]
 
     def get_database(self, DB=DB):
         """
@@ -22,4 +43,14 @@ class MongoDBHandler:
 
         db = self.get_database(DB)
         col = db[COLLECTION]
-        return col
\ No newline at end of file
+        return col
+
+    @classmethod
+    def ensure_index(cls, col, keys: List[Tuple[str, int]]):
+        """Create the index on `col` if it is missing, once per process."""
+        key = (col.database.name, col.name, str(keys))
+        with cls._lock:
+            if key in cls._indexed:
+                return
+            col.create_index(keys)
+            cls._indexed.add(key)
\ No newline at end of file
@@ -1,9 +1,33 @@
 from src.config import OPENAI_API_KEY, MYSQL_HOST, MYSQL_USERNAME, MYSQL_PASSWORD, MYSQL_PORT
 from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Engine
+from typing import Dict, Optional
+import threading
+
+MYSQL_URL = f'mysql+pymysql://{MYSQL_USERNAME}:{MYSQL_PASSWORD}@{MYSQL_HOST}/caesars_reporting_system'
 
 class MySQLHandler:
+    """
+    Hands out one pooled engine per database URL for the whole process,
+    instead of a new engine (and connection pool) per caller.
+    """
+
+    POOL_RECYCLE = 3600 ## Seconds before a pooled connection is replaced, below MySQL's wait_timeout
+
+    _engines: Dict[str, Engine] = {}
+    _lock = threading.Lock()
+
+    def __init__(self, url: Optional[str] = None):
+        """
+        Parameters:
+        url (str): SQLAlchemy database URL, defaults to the reporting MySQL database (e.g. 'sqlite:///competitors.db' for tests).
+        """
+        self.url = url or MYSQL_URL
 
-    def _get_engine(self):
-        engine = create_engine(
-            f'mysql+pymysql://{MYSQL_USERNAME}:{MYSQL_PASSWORD}@{MYSQL_HOST}/caesars_reporting_system')
-        return engine
\ No newline at end of file
+    def _get_engine(self) -> Engine:
+        with self._lock:
+            if self.url not in self._engines:
+                self._engines[self.url] = create_engine(self.url,
+                                                        pool_pre_ping=True,
+                                                        pool_recycle=self.POOL_RECYCLE)
+            return self._engines[self.url]
\ No newline at end of file
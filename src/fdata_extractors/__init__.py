@@ -1,13 +1,26 @@
 from src.fdata_extractors.fmp_extractors.fmp_ecc_extractor import *
 from src.fdata_extractors.fmp_extractors.fmp_findata_extractor import *
+from src.fdata_extractors.fmp_extractors.fmp_client import FMPClient, get_fmp_client
 from src.fdata_extractors.yfinance_extractors.yf_findata_extractor import *
+from src.fdata_extractors.yfinance_extractors.yf_batch_extractor import *
 from src.fdata_extractors.localdb_extractors.mysql_extractor import *
+from .sec_client import SecClient
+from .sec_resolver import SecFilingResolver, SecFiling
+from .rate_limiter import RateLimiter, get_rate_limiter
 from .sec_filing_extractor import *
 
 __all__ = [
     'FMPTranscriptFetcher',
     'FMPAnalyzer',
+    'FMPClient',
+    'get_fmp_client',
     'SecFilingExtractor',
+    'SecClient',
+    'SecFilingResolver',
+    'SecFiling',
+    'RateLimiter',
+    'get_rate_limiter',
     'YFinanceAnalyzer',
+    'YFinanceBatchAnalyzer',
     'MySQLExtractor'
 ]
\ No newline at end of file
@@ -0,0 +1,166 @@
+"""
+batch_extractor.py
+Batch 10-K item extraction into the FDATA_DIR cache read by the report tools (10K_Items_{ticker}.json).
+
+- Sources: a list of tickers (latest 10-K fetched from SEC EDGAR) and / or a directory of raw filings named {ticker}.htm
+- Filings are split with `extract_items` across a process pool, with a timeout per filing
+- Results are written atomically; a timings / failures report is printed at the end
+
+Usage:
+    python -m src.fdata_extractors.batch_extractor --tickers NVDA AMD INTC
+    python -m src.fdata_extractors.batch_extractor --filings-dir path/to/filings --workers 16 --timeout 300
+"""
+from src.config.config import FDATA_DIR, SEC_RATE_LIMIT
+from src.fdata_extractors.utils import extract_items, MAX_WORKERS
+from src.fdata_extractors.sec_filing_extractor import SecFilingExtractor
+from src.fdata_extractors.rate_limiter import get_rate_limiter
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional
+import argparse
+import json
+import multiprocessing
+import os
+import signal
+import time
+
+FILE_TIMEOUT = 600 ## Seconds allowed to fetch and split one filing
+
+
+class FilingTimeoutError(TimeoutError):
+    pass
+
+
+@dataclass
+class ExtractionJob:
+    ticker: str
+    filing_path: Optional[Path] = None # None: fetch the latest 10-K from SEC EDGAR
+
+
+@dataclass
+class ExtractionResult:
+    ticker: str
+    seconds: float
+    output_path: Optional[Path] = None
+    error: Optional[str] = None
+
+
+def output_path_for(ticker: str, output_dir: Path = FDATA_DIR) -> Path:
+    return Path(output_dir) / f'10K_Items_{ticker}.json'
+
+
+def write_items_atomic(items: dict, output_path: Path):
+    # ASCII-only JSON, so the cp1252 reader in ReportDataContext can load it
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = output_path.with_name(f"{output_path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(items, f, ensure_ascii=True)
+        os.replace(tmp_path, output_path)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+
+
+def _init_worker(sec_rate: float):
+    # Each worker process gets an equal share of the SEC request budget.
+    # Workers are spawned, not forked, so no limiter (or client thread) is inherited from the parent.
+    get_rate_limiter('sec', rate=sec_rate)
+
+
+def _on_timeout(signum, frame):
+    raise FilingTimeoutError()
+
+
+def run_job(job: ExtractionJob, output_dir: Path, timeout: int) -> ExtractionResult:
+    """Extract one filing (runs in a worker process). Errors are reported in the result, never raised."""
+    start = time.perf_counter()
+    ## SIGALRM only exists on Unix: elsewhere a filing runs without a time limit
+    use_alarm = timeout and hasattr(signal, 'SIGALRM')
+    if use_alarm:
+        signal.signal(signal.SIGALRM, _on_timeout)
+        signal.alarm(timeout)
+    try:
+        if job.filing_path is not None:
+            html_content = Path(job.filing_path).read_text(encoding='utf-8', errors='replace')
+            items = extract_items(html_content)
+        else:
+            items = SecFilingExtractor().fetch(ticker=job.ticker)
+        if not items:
+            raise ValueError('No item found in the filing')
+        output_path = output_path_for(job.ticker, output_dir)
+        write_items_atomic(items, output_path)
+        return ExtractionResult(job.ticker, time.perf_counter() - start, output_path=output_path)
+    except FilingTimeoutError:
+        return ExtractionResult(job.ticker, time.perf_counter() - start, error=f'Timed out after {timeout} s')
+    except Exception as e:
+        return ExtractionResult(job.ticker, time.perf_counter() - start, error=f'{type(e).__name__}: {e}')
+    finally:
+        if use_alarm:
+            signal.alarm(0)
+
+
+def collect_jobs(tickers: Optional[List[str]] = None, filings_dir: Optional[Path] = None) -> List[ExtractionJob]:
+    jobs = [ExtractionJob(ticker=ticker.upper()) for ticker in (tickers or [])]
+    if filings_dir is not None:
+        for filing_path in sorted(Path(filings_dir).iterdir()):
+            if filing_path.suffix.lower() in ('.htm', '.html'):
+                jobs.append(ExtractionJob(ticker=filing_path.stem.upper(), filing_path=filing_path))
+    return jobs
+
+
+def run_batch(jobs: List[ExtractionJob],
+              output_dir: Path = FDATA_DIR,
+              max_workers: int = MAX_WORKERS,
+              timeout: int = FILE_TIMEOUT,
+              sec_rate: float = SEC_RATE_LIMIT) -> List[ExtractionResult]:
+    """Extract every job on `max_workers` processes sharing `sec_rate` SEC requests / second."""
+    results = []
+    with ProcessPoolExecutor(max_workers=max_workers,
+                             mp_context=multiprocessing.get_context('spawn'),
+                             initializer=_init_worker,
+                             initargs=(sec_rate / max_workers,)) as executor:
+        futures = {executor.submit(run_job, job, output_dir, timeout): job for job in jobs}
+        for future in as_completed(futures):
+            try:
+                result = future.result()
+            except Exception as e: # worker process died
+                result = ExtractionResult(futures[future].ticker, 0.0, error=f'{type(e).__name__}: {e}')
+            status = 'ok' if result.error is None else f'FAILED ({result.error})'
+            print(f"[{result.ticker}] {result.seconds:.2f} s {status}")
+            results.append(result)
+    return results
+
+
+def print_report(results: List[ExtractionResult], elapsed: float):
+    failures = [r for r in results if r.error is not None]
+    print("---")
+    print(f"{len(results) - len(failures)}/{len(results)} filings extracted in {elapsed:.2f} s")
+    if results:
+        slowest = sorted(results, key=lambda r: r.seconds, reverse=True)[:5]
+        print("Slowest: " + ", ".join(f"{r.ticker} {r.seconds:.2f} s" for r in slowest))
+    for r in failures:
+        print(f"Failed: {r.ticker}: {r.error}")
+
+
+if __name__ == '__main__':
+    arg_parser = argparse.ArgumentParser(description='Extract 10-K items for many tickers into the FDATA_DIR cache.')
+    arg_parser.add_argument('--tickers', nargs='*', default=[])
+    arg_parser.add_argument('--filings-dir', type=Path, default=None, help='Directory of raw filings named {ticker}.htm')
+    arg_parser.add_argument('--output-dir', type=Path, default=FDATA_DIR)
+    arg_parser.add_argument('--workers', type=int, default=MAX_WORKERS)
+    arg_parser.add_argument('--timeout', type=int, default=FILE_TIMEOUT, help='Seconds per filing, 0 for no limit')
+    arg_parser.add_argument('--sec-rate', type=float, default=SEC_RATE_LIMIT, help='SEC requests / second, shared by all workers')
+    args = arg_parser.parse_args()
+
+    jobs = collect_jobs(tickers=args.tickers, filings_dir=args.filings_dir)
+    if not jobs:
+        arg_parser.error('Nothing to extract: pass --tickers and / or --filings-dir')
+
+    start = time.perf_counter()
+    results = run_batch(jobs, output_dir=args.output_dir, max_workers=args.workers, timeout=args.timeout,
+                        sec_rate=args.sec_rate)
+    print_report(results, time.perf_counter() - start)
+    raise SystemExit(1 if any(r.error for r in results) else 0)
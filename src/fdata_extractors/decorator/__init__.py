@@ -1,6 +1,7 @@
 from src.fdata_extractors.decorator.findata_decorator import *
 
 __all__ = [
+    'normalize_fdata',
     'apply_selection',
     'apply_selection_growth'
 ]
\ No newline at end of file
@@ -3,8 +3,20 @@ from typing import Callable, List, Optional
 import pandas as pd
 import inspect
 
+def normalize_fdata(df: pd.DataFrame) -> pd.DataFrame:
+    """Return a copy of `df` with snake_case column names and string (date) index, as expected by the selectors."""
+    df = df.copy(deep=False)
+    df.columns = [f"{col}".replace(' ', '_').lower() for col in df.columns]
+    if isinstance(df.index, pd.DatetimeIndex):
+        df.index = pd.DatetimeIndex(df.index.date).astype(str)
+    else:
+        df.index = df.index.astype(str)
+    return df
+
 def apply_selection(data_getter_func: Callable):
-    """Decorator to standardize quarterly/yearly selection and validation."""
+    """Decorator to standardize quarterly/yearly selection and validation.
+    The decorated getter must return a frame already passed through `normalize_fdata`.
+    """
     @wraps(data_getter_func)
     def wrapper(self, **kwargs) -> pd.DataFrame:
         # # Extract named arguments with defaults
@@ -12,10 +24,8 @@ def apply_selection(data_getter_func: Callable):
         n_years = kwargs.get('n_years', None)
         selected_columns = kwargs.get('selected_columns', None)
 
-        # Choose the DataFrame
+        # Choose the (normalized) DataFrame
         df = data_getter_func(self, n_years=n_years, n_quarters=n_quarters)
-        df.columns = [f"{col}".replace(' ', '_').lower() for col in df.columns]
-        caller_name = data_getter_func.__name__
         # Validate input
         self.validate(
             n_quarters=n_quarters,
@@ -25,10 +35,6 @@ def apply_selection(data_getter_func: Callable):
             class_name=self.__class__.__name__,
             caller_name=data_getter_func.__name__,
         )
-        if isinstance(df.index, pd.DatetimeIndex):
-            df.index = pd.DatetimeIndex(df.index.date).astype(str)
-        else:
-            df.index = df.index.astype(str)
 
         # Slice and return
         period = n_quarters if n_quarters is not None else n_years
@@ -42,7 +48,9 @@ def apply_selection(data_getter_func: Callable):
     return wrapper
 
 def apply_selection_growth(data_getter_func: Callable):
-    """Decorator to standardize quarterly/yearly selection and validation."""
+    """Decorator to standardize quarterly/yearly selection and validation, returning period-over-period growth.
+    The decorated getter must return a frame already passed through `normalize_fdata`.
+    """
     @wraps(data_getter_func)
     def wrapper(self, **kwargs) -> pd.DataFrame:
         # Extract named arguments with defaults
@@ -50,10 +58,9 @@ def apply_selection_growth(data_getter_func: Callable):
         n_years = kwargs.get('n_years', None)
         selected_columns = kwargs.get('selected_columns', None)
 
-        # Choose the DataFrame
+        # Choose the (normalized) DataFrame
         # df = data_getter_func(self, quarterly=(n_quarters is not None))
         df = data_getter_func(self, n_years=n_years, n_quarters=n_quarters)
-        df.columns = [f"{col}".replace(' ', '_').lower() for col in df.columns]
         # Validate input
         self.validate(
             n_quarters=n_quarters,
@@ -66,11 +73,6 @@ def apply_selection_growth(data_getter_func: Callable):
 
         # Slice and return
         period = n_quarters if n_quarters is not None else n_years
-        if isinstance(df.index, pd.DatetimeIndex):
-            df.index = pd.DatetimeIndex(df.index.date).astype(str)
-        else:
-            df.index = df.index.astype(str)
-
         if selected_columns is not None:
             selcted_df = df[-period-1:][selected_columns]
         else:
@@ -0,0 +1,78 @@
+"""
+filing_benchmark.py
+Regression and throughput check of the 10-K item splitter across HTML parser backends.
+
+- Every filing of the corpus (*.htm / *.html) is split with each backend
+- Item boundaries (first / last characters of each item, whitespace normalised) are compared to the reference backend
+- Throughput is reported in MB/s per backend
+
+Usage:
+    python -m src.fdata_extractors.filing_benchmark <corpus_dir> [--parsers lxml html.parser] [--reference html.parser]
+"""
+from src.fdata_extractors.utils import extract_items, get_html_parser, HTML_PARSERS
+
+from pathlib import Path
+from typing import Dict, List, Tuple
+import argparse
+import time
+
+BOUNDARY_LENGTH = 100 ## How many characters at each end of an item define its boundary
+
+
+def item_boundaries(items: Dict[str, str]) -> Dict[str, Tuple[str, str]]:
+    boundaries = {}
+    for key, text in items.items():
+        text = ' '.join(text.split())
+        boundaries[key] = (text[:BOUNDARY_LENGTH], text[-BOUNDARY_LENGTH:])
+    return boundaries
+
+
+def run_corpus(corpus_dir: Path, parsers: List[str], reference: str):
+    files = sorted(p for p in Path(corpus_dir).iterdir() if p.suffix.lower() in ('.htm', '.html'))
+    if not files:
+        raise FileNotFoundError(f"[run_corpus] No .htm / .html filings in {corpus_dir}")
+
+    elapsed = {parser: 0.0 for parser in parsers}
+    n_bytes = 0
+    mismatches = []
+    for file_path in files:
+        html_content = file_path.read_text(encoding='utf-8', errors='replace')
+        n_bytes += len(html_content.encode('utf-8'))
+        boundaries = {}
+        for parser in parsers:
+            start = time.perf_counter()
+            try:
+                items = extract_items(html_content, parser=parser)
+            except Exception as e:
+                items = {'error': f"{type(e).__name__}: {e}"}
+            elapsed[parser] += time.perf_counter() - start
+            boundaries[parser] = item_boundaries(items)
+        for parser in parsers:
+            if parser != reference and boundaries[parser] != boundaries[reference]:
+                keys = sorted(set(boundaries[parser]) | set(boundaries[reference]))
+                diff = [k for k in keys if boundaries[parser].get(k) != boundaries[reference].get(k)]
+                mismatches.append((file_path.name, parser, diff))
+
+    print(f"Corpus: {len(files)} filings, {n_bytes / 1e6:.2f} MB")
+    for parser in parsers:
+        print(f"[{parser}] {elapsed[parser]:.2f} s, {n_bytes / 1e6 / elapsed[parser]:.2f} MB/s")
+    if mismatches:
+        print(f"{len(mismatches)} item boundary mismatches against {reference}:")
+        for name, parser, diff in mismatches:
+            print(f"  {name} [{parser}]: {diff}")
+    else:
+        print(f"Item boundaries identical to {reference} for every backend")
+    return mismatches
+
+
+if __name__ == '__main__':
+    arg_parser = argparse.ArgumentParser(description='Compare 10-K item boundaries and throughput across HTML parser backends.')
+    arg_parser.add_argument('corpus_dir', type=Path)
+    arg_parser.add_argument('--parsers', nargs='+', default=HTML_PARSERS)
+    arg_parser.add_argument('--reference', default='html.parser')
+    args = arg_parser.parse_args()
+
+    ## Only benchmark the backends that are installed
+    parsers = list(dict.fromkeys(p for p in args.parsers + [args.reference] if get_html_parser(p) == p))
+    mismatches = run_corpus(args.corpus_dir, parsers, args.reference)
+    raise SystemExit(1 if mismatches else 0)
@@ -0,0 +1,232 @@
+from src.config.config import FMP_API_KEY, CACHE_DIR, FMP_RATE_LIMIT, FMP_MAX_CONNECTIONS, FMP_TIMEOUT
+from src.fdata_extractors.rate_limiter import get_rate_limiter
+
+from concurrent.futures import Future
+from datetime import timedelta
+from pathlib import Path
+from typing import Any, Coroutine, Dict, Iterable, List, Optional, Tuple, Union
+import asyncio
+import hashlib
+import gzip
+import json
+import os
+import random
+import threading
+import time
+import warnings
+import httpx
+
+
+class FMPClient:
+    """
+    Shared client for the FinancialModelingPrep API.
+
+    - One pooled `httpx.AsyncClient` driven by a background event loop, so sync callers, worker threads and
+      other event loops all reuse the same connections
+    - Identical requests already in flight are awaited once, not sent twice
+    - Responses are cached on disk with a time-to-live per endpoint; a stale entry is served if a refresh fails
+    - Every request goes through the shared 'fmp' rate limiter (FMP_RATE_LIMIT), 429 and 5xx responses are retried
+      with exponential backoff (or the server's Retry-After)
+    - Bulk helpers fetch many symbols concurrently through the pool
+    """
+
+    BASE_URL = "https://financialmodelingprep.com"
+    SEGMENTATION_PATH = "stable/revenue-product-segmentation"
+    TRANSCRIPT_PATH = "api/v3/earning_call_transcript"
+
+    SEGMENTATION_TTL = timedelta(days=1)
+    TRANSCRIPT_TTL = timedelta(days=30) # a published transcript does not change
+    EMPTY_TTL = timedelta(hours=1) # empty answers, e.g. a transcript not published yet
+
+    MAX_RETRIES = 5
+    BACKOFF = 1.0 ## Seconds before the first retry, doubled after each attempt
+    MAX_BACKOFF = 60.0
+
+    def __init__(self,
+                 api_key: Optional[str] = FMP_API_KEY,
+                 base_url: str = BASE_URL,
+                 cache_dir: Union[str, Path] = CACHE_DIR / 'fmp',
+                 max_connections: int = FMP_MAX_CONNECTIONS,
+                 timeout: float = FMP_TIMEOUT):
+        """
+        Parameters:
+        api_key (str): FinancialModelingPrep API key.
+        base_url (str): API root, point it at a local server to run on fixtures.
+        cache_dir (str | Path): Directory holding the cached responses.
+        max_connections (int): Size of the connection pool.
+        timeout (float): Seconds per request.
+        """
+        self.api_key = api_key
+        self.base_url = base_url.rstrip('/')
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.rate_limiter = get_rate_limiter('fmp', rate=FMP_RATE_LIMIT)
+        self.n_requests = 0
+        self.n_cache_hits = 0
+        self.n_deduplicated = 0
+
+        self._client = httpx.AsyncClient(timeout=timeout,
+                                         limits=httpx.Limits(max_connections=max_connections,
+                                                             max_keepalive_connections=max_connections))
+        # Only touched from the background loop, no lock needed
+        self._in_flight: Dict[str, asyncio.Task] = {}
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name='fmp-client', daemon=True)
+        self._thread.start()
+
+    ## ---------------------------------------------------- Disk cache ---------------------------------------------------- ##
+    @staticmethod
+    def _key(path: str, params: Dict[str, Any]) -> str:
+        return hashlib.sha256(f"{path}|{json.dumps(params, sort_keys=True)}".encode()).hexdigest()
+
+    def _cache_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json.gz"
+
+    def _read(self, key: str) -> Optional[dict]:
+        try:
+            with gzip.open(self._cache_path(key), 'rt', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write(self, key: str, entry: dict):
+        path = self._cache_path(key)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            with gzip.open(tmp_path, 'wt', encoding='utf-8') as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            warnings.warn(f"[{self.__class__.__name__}._write] Could not cache {entry['path']}: {e}")
+        finally:
+            if tmp_path.exists():
+                tmp_path.unlink()
+
+    ## ---------------------------------------------------- Requests (background loop) ---------------------------------------------------- ##
+    def _backoff(self, attempt: int, response: Optional[httpx.Response] = None) -> float:
+        retry_after = response.headers.get('Retry-After') if response is not None else None
+        if retry_after is not None and retry_after.isdigit():
+            return min(float(retry_after), self.MAX_BACKOFF)
+        return min(self.BACKOFF * 2 ** attempt, self.MAX_BACKOFF) * random.uniform(0.5, 1.0)
+
+    async def _request(self, path: str, params: Dict[str, Any]) -> Any:
+        url = f"{self.base_url}/{path}"
+        for attempt in range(self.MAX_RETRIES + 1):
+            await self.rate_limiter.aacquire()
+            self.n_requests += 1
+            try:
+                response = await self._client.get(url, params={**params, 'apikey': self.api_key})
+            except httpx.TransportError:
+                if attempt == self.MAX_RETRIES:
+                    raise
+                await asyncio.sleep(self._backoff(attempt))
+                continue
+            if (response.status_code == 429 or response.status_code >= 500) and attempt < self.MAX_RETRIES:
+                await asyncio.sleep(self._backoff(attempt, response))
+                continue
+            response.raise_for_status()
+            data = response.json()
+            # FMP reports key / plan errors with a 200 status
+            if isinstance(data, dict) and 'Error Message' in data:
+                raise ValueError(f"[{self.__class__.__name__}._request] {path}: {data['Error Message']}")
+            return data
+
+    async def _fetch_and_cache(self, key: str, path: str, params: Dict[str, Any], ttl: timedelta) -> Any:
+        data = await self._request(path, params)
+        now = time.time()
+        self._write(key, {
+            'path': path,
+            'params': params,
+            'fetched_at': now,
+            'expires_at': now + (ttl if data else min(ttl, self.EMPTY_TTL)).total_seconds(),
+            'data': data,
+        })
+        return data
+
+    async def _get(self, path: str, params: Dict[str, Any], ttl: timedelta) -> Any:
+        key = self._key(path, params)
+        cached = self._read(key)
+        if cached is not None and cached['expires_at'] > time.time():
+            self.n_cache_hits += 1
+            return cached['data']
+
+        task = self._in_flight.get(key)
+        if task is None:
+            task = self._in_flight[key] = asyncio.ensure_future(self._fetch_and_cache(key, path, params, ttl))
+            task.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        else:
+            self.n_deduplicated += 1
+        try:
+            return await asyncio.shield(task)
+        except Exception as e:
+            if cached is None:
+                raise
+            warnings.warn(f"[{self.__class__.__name__}._get] Serving stale {path} {params}: {e}")
+            return cached['data']
+
+    async def _get_many(self, calls: List[Tuple[str, Dict[str, Any]]], ttl: timedelta) -> List[Any]:
+        return await asyncio.gather(*(self._get(path, params, ttl) for path, params in calls), return_exceptions=True)
+
+    ## ---------------------------------------------------- Public API ---------------------------------------------------- ##
+    def _submit(self, coro: Coroutine) -> Future:
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
+
+    def get_json(self, path: str, params: Optional[Dict[str, Any]] = None, ttl: timedelta = SEGMENTATION_TTL) -> Any:
+        """GET `path` (relative to base_url) as JSON. Blocks the calling thread, never call it from the client's own loop."""
+        return self._submit(self._get(path, params or {}, ttl)).result()
+
+    async def aget_json(self, path: str, params: Optional[Dict[str, Any]] = None, ttl: timedelta = SEGMENTATION_TTL) -> Any:
+        """`get_json` for coroutines, usable from any event loop."""
+        return await asyncio.wrap_future(self._submit(self._get(path, params or {}, ttl)))
+
+    def get_json_many(self, calls: List[Tuple[str, Dict[str, Any]]], ttl: timedelta = SEGMENTATION_TTL) -> List[Any]:
+        """Many GETs sent concurrently through the pool. A failed call yields its exception in place of the result."""
+        return self._submit(self._get_many(calls, ttl)).result()
+
+    def get_product_segmentation(self, symbol: str, period: str = 'annual') -> List[dict]:
+        return self.get_json(self.SEGMENTATION_PATH, {'symbol': symbol, 'period': period}, ttl=self.SEGMENTATION_TTL)
+
+    def get_product_segmentation_many(self, symbols: Iterable[str], period: str = 'annual') -> Dict[str, List[dict]]:
+        """{symbol: segmentation records}, symbols whose request failed are left out with a warning."""
+        symbols = list(dict.fromkeys(symbols))
+        results = self.get_json_many([(self.SEGMENTATION_PATH, {'symbol': s, 'period': period}) for s in symbols],
+                                     ttl=self.SEGMENTATION_TTL)
+        return self._collect(symbols, results)
+
+    def get_transcript(self, symbol: str, year: int, quarter: int) -> List[dict]:
+        return self.get_json(f"{self.TRANSCRIPT_PATH}/{symbol}", {'year': year, 'quarter': quarter}, ttl=self.TRANSCRIPT_TTL)
+
+    def get_transcripts_many(self, keys: Iterable[Tuple[str, int, int]]) -> Dict[Tuple[str, int, int], List[dict]]:
+        """{(symbol, year, quarter): transcript records}, keys whose request failed are left out with a warning."""
+        keys = list(dict.fromkeys(keys))
+        results = self.get_json_many([(f"{self.TRANSCRIPT_PATH}/{s}", {'year': y, 'quarter': q}) for s, y, q in keys],
+                                     ttl=self.TRANSCRIPT_TTL)
+        return self._collect(keys, results)
+
+    def _collect(self, keys: list, results: List[Any]) -> dict:
+        collected = {}
+        for key, result in zip(keys, results):
+            if isinstance(result, Exception):
+                warnings.warn(f"[{self.__class__.__name__}._collect] {key}: {type(result).__name__}: {result}")
+            else:
+                collected[key] = result
+        return collected
+
+    def close(self):
+        if self._loop.is_running():
+            self._submit(self._client.aclose()).result()
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+        self._loop.close()
+
+
+_FMP_CLIENT: Optional[FMPClient] = None
+_FMP_CLIENT_LOCK = threading.Lock()
+
+def get_fmp_client() -> FMPClient:
+    """Process-wide FMP client shared by every FMP extractor."""
+    global _FMP_CLIENT
+    with _FMP_CLIENT_LOCK:
+        if _FMP_CLIENT is None:
+            _FMP_CLIENT = FMPClient()
+        return _FMP_CLIENT
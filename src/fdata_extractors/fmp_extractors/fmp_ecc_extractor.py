@@ -1,8 +1,9 @@
-from src.config.config import FMP_API_KEY, ECC_COLLECTION
+from src.config.config import ECC_COLLECTION
 from src.abstractions import TextDataABC
 from src.database import MongoDBHandler
+from src.fdata_extractors.fmp_extractors.fmp_client import FMPClient, get_fmp_client
 from dotenv import load_dotenv
-import requests
+from typing import Dict, Iterable, Optional, Tuple
 
 # Load environment variables from .env file
 load_dotenv()
@@ -12,17 +13,20 @@ class FMPTranscriptFetcher(TextDataABC):
     A simple class to fetch earnings call transcripts from FinancialModelingPrep.
     """
 
-    BASE_URL = "https://financialmodelingprep.com/api/v3/earning_call_transcript"
+    DB_INDEX = [('symbol', 1), ('year', 1), ('quarter', 1)]
+    DB_PROJECTION = {'content': 1, '_id': 0}
 
-    def __init__(self):
+    def __init__(self, col=None, client: Optional[FMPClient] = None):
         """
-        Initialize the fetcher with your API key.
+        Initialize the fetcher.
 
         Args:
-            api_key (str): Your FinancialModelingPrep API key.
+            col (Collection): Transcript collection, defaults to ECC_COLLECTION on the shared Mongo client.
+            client (FMPClient): FMP client, defaults to the process-wide one.
         """
-        self.api_key = FMP_API_KEY
-        self.col = MongoDBHandler().get_collection(ECC_COLLECTION)
+        self.client = client if client is not None else get_fmp_client()
+        self.col = col if col is not None else MongoDBHandler().get_collection(ECC_COLLECTION)
+        MongoDBHandler.ensure_index(self.col, self.DB_INDEX)
 
     def fetch(self, ticker: str, year: int, quarter: int) -> dict:
         """
@@ -36,22 +40,81 @@ class FMPTranscriptFetcher(TextDataABC):
         Returns:
             dict: Parsed JSON response from the API.
         """
-        url = f"{self.BASE_URL}/{ticker}"
-        params = {
-            "year": year,
-            "quarter": quarter,
-            "apikey": self.api_key
-        }
-        response = requests.get(url, params=params)
-        response.raise_for_status()
-        return response.json()[0]
+        return self.client.get_transcript(ticker, year, quarter)[0]
 
     def fetch_from_db(self, ticker: str, year: int, quarter: int) -> dict:
+        """
+        Transcript stored for a given ticker, year, and quarter, only its `content` field is loaded.
 
-        response = self.col.find(
+        Returns:
+            dict: {'content': transcript}
+        """
+        response = self.col.find_one(
             {'symbol': ticker,
              'year': year,
-             'quarter': quarter}
+             'quarter': quarter},
+            self.DB_PROJECTION
         )
-        response = [i for i in response][0]
-        return response
\ No newline at end of file
+        if response is None:
+            raise ValueError(f"[{self.__class__.__name__}.fetch_from_db] No transcript for {ticker} {year} Q{quarter}")
+        return response
+
+    def fetch_many(self, keys: Iterable[Tuple[str, int, int]]) -> Dict[Tuple[str, int, int], dict]:
+        """
+        Transcripts for many (ticker, year, quarter) keys in one query.
+
+        Returns:
+            dict: {(ticker, year, quarter): {'content': transcript}}, keys without a transcript are left out.
+        """
+        keys = set(keys)
+        if not keys:
+            return {}
+        ## $in on each field selects a superset of the requested keys, the extra combinations are dropped below
+        cursor = self.col.find(
+            {'symbol': {'$in': sorted({k[0] for k in keys})},
+             'year': {'$in': sorted({k[1] for k in keys})},
+             'quarter': {'$in': sorted({k[2] for k in keys})}},
+            {'symbol': 1, 'year': 1, 'quarter': 1, 'content': 1, '_id': 0}
+        )
+        transcripts = {}
+        for doc in cursor:
+            key = (doc['symbol'], doc['year'], doc['quarter'])
+            if key in keys and key not in transcripts:
+                transcripts[key] = {'content': doc['content']}
+        return transcripts
+
+
+if __name__ == '__main__':
+    ## Benchmark: unprojected find + list per lookup (previous behaviour) vs. find_one with projection vs. one fetch_many,
+    ## against MONGODB_URI when set, mongomock otherwise
+    from src.config import MONGODB_URI
+    import time
+
+    if MONGODB_URI:
+        col = MongoDBHandler().get_database('ecc_benchmark')['transcripts']
+    else:
+        import mongomock
+        col = mongomock.MongoClient()['ecc_benchmark']['transcripts']
+    col.drop()
+    tickers = [f'T{i:03d}' for i in range(200)]
+    col.insert_many([
+        {'symbol': t, 'year': y, 'quarter': q, 'date': f'{y}-0{3 * q}-01', 'content': 'x' * 50_000}
+        for t in tickers for y in (2023, 2024, 2025) for q in (1, 2, 3, 4)
+    ])
+    fetcher = FMPTranscriptFetcher(col=col)
+    keys = [(t, 2025, 1) for t in tickers]
+
+    start = time.perf_counter()
+    for t, y, q in keys:
+        [i for i in col.find({'symbol': t, 'year': y, 'quarter': q})][0]
+    print(f"[find + list] Elapsed: {time.perf_counter() - start:.4f} s")
+
+    start = time.perf_counter()
+    for t, y, q in keys:
+        fetcher.fetch_from_db(ticker=t, year=y, quarter=q)
+    print(f"[find_one + projection] Elapsed: {time.perf_counter() - start:.4f} s")
+
+    start = time.perf_counter()
+    transcripts = fetcher.fetch_many(keys)
+    print(f"[fetch_many] Elapsed: {time.perf_counter() - start:.4f} s, {len(transcripts)} transcripts")
+    col.drop()
\ No newline at end of file
@@ -1,15 +1,26 @@
-from src.config.config import FMP_API_KEY, ECC_COLLECTION
-from src.fdata_extractors.decorator import apply_selection, apply_selection_growth
+from src.fdata_extractors.decorator import apply_selection, apply_selection_growth, normalize_fdata
 from src.fdata_extractors.findata_validator import FinDataValidator
+from src.fdata_extractors.fmp_extractors.fmp_client import FMPClient, get_fmp_client
+from typing import Dict, List, Optional
 import pandas as pd
-import requests
 
 class FMPAnalyzer(FinDataValidator):
-    BASE_URL = "https://financialmodelingprep.com/stable/revenue-product-segmentation"
 
-    def __init__(self, ticker: str):
-        self.api_key = FMP_API_KEY
+    def __init__(self, ticker: str, client: Optional[FMPClient] = None):
+        """
+        Parameters:
+        ticker (str): The stock ticker, e.g. "AAPL".
+        client (FMPClient): FMP client, defaults to the process-wide one.
+        """
         self.ticker = ticker
+        self.client = client if client is not None else get_fmp_client()
+        # Segmentation payloads keyed on period, shared by the level and growth getters
+        self._segmentation: Dict[str, List[dict]] = {}
+
+    def _get_segmentation(self, period: str) -> List[dict]:
+        if period not in self._segmentation:
+            self._segmentation[period] = self.client.get_product_segmentation(self.ticker, period=period)
+        return self._segmentation[period]
 
     def get_product_data(self, n_years: int=None, n_quarters: int=None):
         def _convert_df_format(records):
@@ -31,28 +42,23 @@ class FMPAnalyzer(FinDataValidator):
 
             return pivot_df
         if n_years is not None:
-            url = f"{self.BASE_URL}?symbol={self.ticker}&period=annual"
+            period, n_periods = 'annual', n_years
         elif n_quarters is not None:
-            url = f"{self.BASE_URL}?symbol={self.ticker}&period=quarter"
+            period, n_periods = 'quarter', n_quarters
         else:
             return pd.DataFrame()
 
-        params = {
-            "apikey": self.api_key
-        }
-        response = requests.get(url, params=params)
-        response.raise_for_status()
-        response = response.json()[:n_years+1]
+        response = self._get_segmentation(period)[:n_periods+1]
         df = _convert_df_format(response)
         return df.sort_index()
 
     @apply_selection
     def get_product_segment_revenue(self, n_years: int=None, n_quarters: int=None):
-        return self.get_product_data(n_years=n_years, n_quarters=n_quarters)
+        return normalize_fdata(self.get_product_data(n_years=n_years, n_quarters=n_quarters))
 
     @apply_selection_growth
     def get_product_segment_revenue_growth(self, n_years: int=None, n_quarters: int=None):
-        return self.get_product_data(n_years=n_years, n_quarters=n_quarters)
+        return normalize_fdata(self.get_product_data(n_years=n_years, n_quarters=n_quarters))
 
 if __name__ == "__main__":
     fmp = FMPAnalyzer("AAPL")
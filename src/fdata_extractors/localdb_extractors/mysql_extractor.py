@@ -1,22 +1,72 @@
-from yfinance import tickers
-
 from src.database import MySQLHandler
+from sqlalchemy import text, bindparam
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import DBAPIError
+from typing import Dict, List, Optional
 import pandas as pd
 
 class MySQLExtractor:
 
-    def __init__(self, ticker):
-        sql = MySQLHandler()
+    COMPETITORS_TABLE = 'caesars_reporting_system.competitors_selectedfrom1100'
+    COMPETITORS_INDEX = 'idx_competitors_ticker_rank'
+
+    def __init__(self, ticker, engine: Optional[Engine] = None, table: str = COMPETITORS_TABLE):
+        """
+        Parameters:
+        ticker (str): Company ticker.
+        engine (Engine): Database engine, defaults to the shared pooled MySQL engine.
+        table (str): Competitors table.
+        """
         self.ticker = ticker
-        self.engine = sql._get_engine()
+        self.engine = engine if engine is not None else MySQLHandler()._get_engine()
+        self.table = table
 
     def _get_competitors(self, competitors_limit):
+        """Top `competitors_limit` competitors of the ticker, by competitor_rank."""
+        query = text(
+            f"SELECT * FROM {self.table} "
+            "WHERE company_ticker = :ticker "
+            "ORDER BY competitor_rank "
+            "LIMIT :limit"
+        )
+        return pd.read_sql(query, self.engine, params={'ticker': self.ticker, 'limit': competitors_limit})
 
-        df_competitors = pd.read_sql("SELECT * FROM caesars_reporting_system.competitors_selectedfrom1100", self.engine)
-        return df_competitors[df_competitors["company_ticker"] == self.ticker].reset_index(drop=True).iloc[:competitors_limit]
+    @classmethod
+    def get_competitors_bulk(cls,
+                             tickers: List[str],
+                             competitors_limit: int,
+                             engine: Optional[Engine] = None,
+                             table: str = COMPETITORS_TABLE) -> Dict[str, pd.DataFrame]:
+        """Top `competitors_limit` competitors of every ticker, loaded with one query: {ticker: competitors}."""
+        engine = engine if engine is not None else MySQLHandler()._get_engine()
+        tickers = list(dict.fromkeys(tickers))
+        query = text(
+            f"SELECT * FROM {table} "
+            "WHERE company_ticker IN :tickers "
+            "ORDER BY company_ticker, competitor_rank"
+        ).bindparams(bindparam('tickers', expanding=True))
+        df = pd.read_sql(query, engine, params={'tickers': tickers})
+        grouped = dict(tuple(df.groupby('company_ticker', sort=False)))
+        return {
+            ticker: grouped[ticker].head(competitors_limit).reset_index(drop=True) if ticker in grouped else df.iloc[0:0]
+            for ticker in tickers
+        }
+
+    @classmethod
+    def create_index(cls, engine: Optional[Engine] = None, table: str = COMPETITORS_TABLE):
+        """Index backing the competitor lookups. Safe to call when the index already exists."""
+        engine = engine if engine is not None else MySQLHandler()._get_engine()
+        ## MySQL can only index a prefix of TEXT columns (pandas' to_sql creates company_ticker as TEXT)
+        ticker_column = 'company_ticker(32)' if engine.dialect.name == 'mysql' else 'company_ticker'
+        try:
+            with engine.begin() as conn:
+                conn.execute(text(f"CREATE INDEX {cls.COMPETITORS_INDEX} ON {table} ({ticker_column}, competitor_rank)"))
+        except DBAPIError as e:
+            if 'exists' not in str(e).lower() and 'duplicate' not in str(e).lower():
+                raise
 
 
 if __name__ == "__main__":
     extractor = MySQLExtractor(ticker='AAPL')
-    print(extractor._get_competitors())
-
+    print(extractor._get_competitors(competitors_limit=3))
+    print(MySQLExtractor.get_competitors_bulk(['AAPL', 'MSFT', 'NVDA'], competitors_limit=3))
@@ -0,0 +1,54 @@
+from typing import Dict, Optional
+import asyncio
+import threading
+import time
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket: at most `rate` calls per `per` seconds, with bursts up to `burst` calls.
+    `acquire` blocks the calling thread, `aacquire` awaits without blocking the event loop.
+    """
+
+    def __init__(self, rate: float, per: float = 1.0, burst: Optional[int] = None):
+        self.rate = rate
+        self.per = per
+        self.capacity = burst if burst is not None else max(1, int(rate))
+        self._tokens = float(self.capacity)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Take one token, returns how long the caller must wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate / self.per)
+            self._updated_at = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens * self.per / self.rate
+
+    def acquire(self):
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def aacquire(self):
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+_RATE_LIMITERS: Dict[str, RateLimiter] = {}
+_RATE_LIMITERS_LOCK = threading.Lock()
+
+def get_rate_limiter(name: str, rate: float, per: float = 1.0, burst: Optional[int] = None) -> RateLimiter:
+    """
+    Process-wide limiter shared by every client of one upstream (e.g. 'sec', 'fmp', 'yahoo').
+    The first call for a name defines its rate; later calls return the same limiter.
+    """
+    with _RATE_LIMITERS_LOCK:
+        if name not in _RATE_LIMITERS:
+            _RATE_LIMITERS[name] = RateLimiter(rate=rate, per=per, burst=burst)
+        return _RATE_LIMITERS[name]
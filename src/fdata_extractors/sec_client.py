@@ -0,0 +1,147 @@
+from src.config.config import CACHE_DIR, SEC_RATE_LIMIT
+from src.fdata_extractors.rate_limiter import get_rate_limiter
+
+from pathlib import Path
+from typing import Optional, Union
+import requests
+import hashlib
+import gzip
+import json
+import os
+import re
+import threading
+
+# SEC requires a descriptive User-Agent
+USER_AGENT = os.getenv("SEC_USER_AGENT", "My Name <my.email@example.com>")
+HEADERS = {"User-Agent": USER_AGENT, "Accept-Encoding": "gzip, deflate"}
+BASE_URL = "https://www.sec.gov"
+
+ACCESSION_PATTERN = re.compile(r'(\d{10}-\d{2}-\d{6})|(\d{18})')
+
+
+class SecClient:
+    """
+    HTTP client for SEC EDGAR.
+
+    - One pooled `requests.Session` per process, every request going through the shared 'sec' rate limiter (SEC_RATE_LIMIT)
+    - Feeds and index pages: conditional GET (ETag / Last-Modified), the body is served from disk on 304 Not Modified
+    - Filing documents: streamed gzip-to-disk into a content-addressed cache keyed by accession number.
+      Filed documents never change, so a cached document is never downloaded again
+    """
+
+    CHUNK_SIZE = 1 << 16
+
+    _session: Optional[requests.Session] = None
+    _session_lock = threading.Lock()
+
+    def __init__(self, cache_dir: Union[str, Path] = CACHE_DIR / 'sec', timeout: float = 60):
+        self.cache_dir = Path(cache_dir)
+        self.timeout = timeout
+        self.rate_limiter = get_rate_limiter('sec', rate=SEC_RATE_LIMIT)
+        (self.cache_dir / 'http').mkdir(parents=True, exist_ok=True)
+        (self.cache_dir / 'filings').mkdir(parents=True, exist_ok=True)
+
+    @classmethod
+    def session(cls) -> requests.Session:
+        with cls._session_lock:
+            if cls._session is None:
+                cls._session = requests.Session()
+                cls._session.headers.update(HEADERS)
+            return cls._session
+
+    def _request(self, url: str, **kwargs) -> requests.Response:
+        self.rate_limiter.acquire()
+        return self.session().get(url, timeout=self.timeout, **kwargs)
+
+    @staticmethod
+    def _atomic_write(path: Path, data: bytes):
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, path)
+        finally:
+            if tmp_path.exists():
+                tmp_path.unlink()
+
+    ## ---------------------------------------------------- Conditional GET ---------------------------------------------------- ##
+    def get_text(self, url: str) -> str:
+        """GET `url` as text, revalidating the cached copy with ETag / Last-Modified instead of re-downloading it."""
+        key = hashlib.sha256(url.encode()).hexdigest()
+        meta_path = self.cache_dir / 'http' / f'{key}.meta.json'
+        body_path = self.cache_dir / 'http' / f'{key}.gz'
+
+        meta = None
+        headers = {}
+        if meta_path.exists() and body_path.exists():
+            meta = json.loads(meta_path.read_text(encoding='utf-8'))
+            if meta.get('etag'):
+                headers['If-None-Match'] = meta['etag']
+            if meta.get('last_modified'):
+                headers['If-Modified-Since'] = meta['last_modified']
+
+        resp = self._request(url, headers=headers)
+        if resp.status_code == 304 and meta is not None:
+            return gzip.decompress(body_path.read_bytes()).decode(meta['encoding'], errors='replace')
+        resp.raise_for_status()
+
+        encoding = resp.encoding or 'utf-8'
+        self._atomic_write(body_path, gzip.compress(resp.content))
+        self._atomic_write(meta_path, json.dumps({
+            'url': url,
+            'etag': resp.headers.get('ETag'),
+            'last_modified': resp.headers.get('Last-Modified'),
+            'encoding': encoding,
+        }).encode('utf-8'))
+        return resp.content.decode(encoding, errors='replace')
+
+    def get_json(self, url: str):
+        return json.loads(self.get_text(url))
+
+    ## ---------------------------------------------------- Filing documents ---------------------------------------------------- ##
+    @staticmethod
+    def accession_from(text: str) -> Optional[str]:
+        """Accession number (0001045810-24-000029 form) found in a URL or feed field, if any."""
+        match = ACCESSION_PATTERN.search(text or '')
+        if match is None:
+            return None
+        if match.group(1):
+            return match.group(1)
+        digits = match.group(2)
+        return f"{digits[:10]}-{digits[10:12]}-{digits[12:]}"
+
+    def document_path(self, accession: str, url: str) -> Path:
+        return self.cache_dir / 'filings' / accession / f"{Path(url.split('?')[0]).name}.gz"
+
+    def download_document(self, url: str, accession: str) -> Path:
+        """Stream a filing document gzip-to-disk (once per accession number), returns the cached file."""
+        path = self.document_path(accession, url)
+        if path.exists():
+            return path
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            with self._request(url, stream=True) as resp:
+                resp.raise_for_status()
+                with gzip.open(tmp_path, 'wb') as f:
+                    for chunk in resp.iter_content(chunk_size=self.CHUNK_SIZE):
+                        f.write(chunk)
+                encoding = resp.encoding or 'utf-8'
+            self._atomic_write(path.with_name(f"{path.name}.meta.json"),
+                               json.dumps({'url': url, 'accession': accession, 'encoding': encoding}).encode('utf-8'))
+            os.replace(tmp_path, path)
+        finally:
+            if tmp_path.exists():
+                tmp_path.unlink()
+        return path
+
+    def read_document(self, path: Path) -> str:
+        meta_path = path.with_name(f"{path.name}.meta.json")
+        encoding = 'utf-8'
+        if meta_path.exists():
+            encoding = json.loads(meta_path.read_text(encoding='utf-8')).get('encoding') or encoding
+        with gzip.open(path, 'rb') as f:
+            return f.read().decode(encoding, errors='replace')
+
+    def get_document(self, url: str, accession: str) -> str:
+        return self.read_document(self.download_document(url, accession))
@@ -0,0 +1,87 @@
+from src.fdata_extractors.sec_client import SecClient, BASE_URL
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+DATA_URL = "https://data.sec.gov"
+
+
+@dataclass(frozen=True)
+class SecFiling:
+    cik: int
+    accession: str
+    filing_date: str
+    form: str
+    primary_document: str
+    url: str
+
+
+## ---------------------------------------------------- Pure resolvers (usable on local fixtures) ---------------------------------------------------- ##
+def build_cik_map(company_tickers: dict) -> Dict[str, int]:
+    """{TICKER: cik} from SEC `company_tickers.json` ({"0": {"cik_str": 320193, "ticker": "AAPL", ...}, ...})."""
+    return {row['ticker'].upper(): int(row['cik_str']) for row in company_tickers.values()}
+
+
+def primary_document_url(cik: int, accession: str, primary_document: str, base_url: str = BASE_URL) -> str:
+    return f"{base_url}/Archives/edgar/data/{int(cik)}/{accession.replace('-', '')}/{primary_document}"
+
+
+def resolve_filings(submissions: dict, form_type: str = "10-K", base_url: str = BASE_URL) -> List[SecFiling]:
+    """
+    Filings of `form_type` filed in the latest year that has one, newest first,
+    from an EDGAR submissions index (`submissions/CIK##########.json`).
+    """
+    recent = submissions.get('filings', {}).get('recent', {})
+    cik = int(submissions['cik'])
+    filings = [
+        SecFiling(cik=cik,
+                  accession=accession,
+                  filing_date=filing_date,
+                  form=form,
+                  primary_document=primary_document,
+                  url=primary_document_url(cik, accession, primary_document, base_url))
+        for accession, filing_date, form, primary_document in zip(recent.get('accessionNumber', []),
+                                                                 recent.get('filingDate', []),
+                                                                 recent.get('form', []),
+                                                                 recent.get('primaryDocument', []))
+        if form == form_type and primary_document
+    ]
+    if not filings:
+        return []
+    filings.sort(key=lambda f: f.filing_date, reverse=True)
+    latest_year = filings[0].filing_date[:4]
+    return [f for f in filings if f.filing_date[:4] == latest_year]
+
+
+## ---------------------------------------------------- Resolver ---------------------------------------------------- ##
+class SecFilingResolver:
+    """
+    Find filing documents from the EDGAR JSON indexes: ticker -> CIK from `company_tickers.json` (fetched once per resolver),
+    then the primary document of each filing from `submissions/CIK##########.json`.
+    Point `base_url` / `data_url` at a local server to run on fixtures.
+    """
+
+    def __init__(self, client: Optional[SecClient] = None, base_url: str = BASE_URL, data_url: str = DATA_URL):
+        self.client = client if client is not None else SecClient()
+        self.base_url = base_url
+        self.data_url = data_url
+        self._cik_map: Optional[Dict[str, int]] = None
+
+    def cik_map(self) -> Dict[str, int]:
+        if self._cik_map is None:
+            self._cik_map = build_cik_map(self.client.get_json(f"{self.base_url}/files/company_tickers.json"))
+        return self._cik_map
+
+    def get_cik(self, ticker: str) -> int:
+        if str(ticker).isdigit():
+            return int(ticker)
+        try:
+            return self.cik_map()[ticker.upper()]
+        except KeyError:
+            raise ValueError(f"[{self.__class__.__name__}.get_cik] Unknown ticker: {ticker}")
+
+    def get_submissions(self, cik: int) -> dict:
+        return self.client.get_json(f"{self.data_url}/submissions/CIK{int(cik):010d}.json")
+
+    def latest_filings(self, ticker: str, form_type: str = "10-K") -> List[SecFiling]:
+        return resolve_filings(self.get_submissions(self.get_cik(ticker)), form_type=form_type, base_url=self.base_url)
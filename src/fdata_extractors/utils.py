@@ -1,13 +1,14 @@
 import os
 import re
+import bisect
+import functools
 import itertools
 import pandas as pd
 
 from bs4 import BeautifulSoup
+from bs4.builder import builder_registry
 from bs4.element import Tag
 from bs4.element import NavigableString
-from concurrent.futures import ProcessPoolExecutor, as_completed
-import concurrent.futures
 ITEMS = {
     'item1': 'Item 1',
     'item1a': 'Item 1A',
@@ -30,6 +31,24 @@ SYMBOL_TERMINATORS = ['.', ' .', ' :', ':', '-', ' -', '—', ' —', '\t']
 NON_SYMBOL_TERMINATORS = [' ']
 MAX_WORKERS = 8
 
+# BeautifulSoup tree builders able to parse the filings.
+# html.parser is the default and the reference output; lxml is several times faster and opt-in (SEC_HTML_PARSER=lxml)
+# until the corpus in tests/fixtures/filings, checked by tests/test_filing_parsers.py, covers enough real filings.
+# An unavailable choice falls back to the next installed builder.
+HTML_PARSERS = ['lxml', 'html.parser']
+HTML_PARSER = os.getenv('SEC_HTML_PARSER', 'html.parser')
+
+
+def get_html_parser(parser=None):
+    for candidate in [parser or HTML_PARSER] + HTML_PARSERS:
+        if builder_registry.lookup(candidate) is not None:
+            return candidate
+    return 'html.parser'
+
+
+def parse_html(html_content, parser=None):
+    return BeautifulSoup(html_content, get_html_parser(parser))
+
 
 def get_part_by_item(item_key):
     for part_key, items in PARTS.items():
@@ -83,23 +102,65 @@ def check_same_tags(tag1, tag2):
     return tag1 is None and tag2 is None
 
 
-def search_tags(html_tag, item_value, results, depth=1, max_content_length=500):
-    # Check if the tag contains the item_value as the beginning of any direct text node
-    for content in html_tag.contents:
-        if isinstance(content, NavigableString):
-            text_content = content.strip().lower()
-            terminators = SYMBOL_TERMINATORS + NON_SYMBOL_TERMINATORS
-            possible_starts = [item_value.lower() + terminator for terminator in terminators]
-            # Without space
-            possible_starts += [item_value.lower().replace(' ', '') + terminator for terminator in terminators]
-            if len(text_content) <= max_content_length and (
-                any(text_content.startswith(start) for start in possible_starts) or
-                text_content == item_value.lower() or text_content == item_value.lower().replace(' ', '')
-            ):
-                results.append((html_tag, depth))
-                break  # Once found, no need to add the same tag again
+@functools.lru_cache(maxsize=None)
+def _item_header_pattern(item_values):
+    # One regex for every item header: "item 1a" / "item1a" followed by a terminator or by nothing.
+    # No item value followed by a terminator is the prefix of another one, so a text matches at most one item
+    variants = {}
+    for item_value in item_values:
+        variants[item_value] = item_value
+        variants[item_value.replace(' ', '')] = item_value
+    terminators = SYMBOL_TERMINATORS + NON_SYMBOL_TERMINATORS
+    pattern = re.compile(
+        r'(' + '|'.join(re.escape(v) for v in sorted(variants, key=len, reverse=True)) + r')'
+        r'(?:' + '|'.join(re.escape(terminator) for terminator in terminators) + r'|\Z)'
+    )
+    return pattern, variants
+
+
+def search_item_tags(html_tag, items=None, depth=1, max_content_length=500):
+    """
+    Find the header tags of every item in a single iterative pass over html_tag.
+    A tag is a header of an item when one of its direct text nodes starts with the item value (e.g. "Item 1A.").
+
+    Returns {item_key: [(tag, depth), ...]} in document order, the same as one search_tags call per item.
+    """
+    items = ITEMS if items is None else items
+    pattern, variants = _item_header_pattern(tuple(value.lower() for value in items.values()))
+    keys = {value.lower(): key for key, value in items.items()}
+    results = {key: [] for key in items}
+
+    # Each frame: (tag, depth, iterator over its contents, items still searched in this tag)
+    stack = [(html_tag, depth, iter(html_tag.contents), set(keys))]
+    while stack:
+        tag, tag_depth, contents, active_items = stack[-1]
+        child = None
+        for content in contents:
+            if isinstance(content, NavigableString):
+                if len(content) > max_content_length and len(content.strip()) > max_content_length:
+                    continue
+                match = pattern.match(content.strip().lower())
+                if match:
+                    item_value = variants[match.group(1)]
+                    if item_value in active_items:
+                        results[keys[item_value]].append((tag, tag_depth))
+                        # Once found, no need to add the same tag again for this item
+                        active_items.discard(item_value)
+                        if not active_items:
+                            break
+            else:
+                child = content
+                break
+        if child is None:
+            stack.pop()
         else:
-            search_tags(content, item_value, results, depth + 1, max_content_length)
+            stack.append((child, tag_depth + 1, iter(child.contents), set(active_items)))
+    return results
+
+
+def search_tags(html_tag, item_value, results, depth=1, max_content_length=500):
+    # Single item search, kept for backward compatibility: see search_item_tags
+    results.extend(search_item_tags(html_tag, {item_value: item_value}, depth, max_content_length)[item_value])
     return None
 
 
@@ -113,92 +174,200 @@ def filter_tags(html_tag):
     return False
 
 
-def find_common_ancestor(item_tags):
+class AncestorIndex:
+    """
+    Depth, Euler-tour interval and text offset of every tag of a parsed document, computed in one traversal.
+    Ancestor checks are O(1) interval tests, common ancestor queries a binary search on one ancestor chain
+    and text distances a subtraction of offsets.
+    Tags are keyed by identity: bs4 hashes and compares tags by their serialised content.
+    """
+
+    def __init__(self, root):
+        self.root = root
+        self.depth = {}  # id(tag) -> number of parents
+        self.tin = {}    # id(tag) -> position where the traversal enters the tag
+        self.tout = {}   # id(tag) -> position where the traversal leaves the tag
+        self.text_offset = {}  # id(tag) -> number of text characters before the tag
+        counter = 0
+        n_chars = 0
+        stack = [(root, 0, iter(root.contents))]
+        self.depth[id(root)] = 0
+        self.tin[id(root)] = counter
+        self.text_offset[id(root)] = n_chars
+        while stack:
+            tag, tag_depth, children = stack[-1]
+            child = None
+            for content in children:
+                if isinstance(content, Tag):
+                    child = content
+                    break
+                n_chars += len(content)
+            counter += 1
+            if child is None:
+                self.tout[id(tag)] = counter
+                stack.pop()
+            else:
+                self.depth[id(child)] = tag_depth + 1
+                self.tin[id(child)] = counter
+                self.text_offset[id(child)] = n_chars
+                stack.append((child, tag_depth + 1, iter(child.contents)))
+
+    @classmethod
+    def from_tag(cls, tag):
+        # Index the whole document the tag belongs to
+        root = tag
+        while root.parent is not None:
+            root = root.parent
+        return cls(root)
+
+    def is_ancestor(self, ancestor, tag):
+        """True when `ancestor` is `tag` or one of its parents."""
+        return self.tin[id(ancestor)] <= self.tin[id(tag)] and self.tout[id(tag)] <= self.tout[id(ancestor)]
+
+    @staticmethod
+    def chain(tag):
+        """The tag's ancestors from the document root down to the tag itself."""
+        chain = [tag]
+        chain.extend(tag.parents)
+        chain.reverse()
+        return chain
+
+    def text_distance(self, tag1, tag2):
+        """Characters of text from the start of tag1 to the start of tag2, 0 when tag2 does not come after tag1."""
+        if self.tin[id(tag2)] <= self.tin[id(tag1)]:
+            return 0
+        return self.text_offset[id(tag2)] - self.text_offset[id(tag1)]
+
+    def common_ancestor(self, tags):
+        """Deepest tag that is a strict ancestor of every tag (None when they are in different documents)."""
+        chain = self.chain(tags[0])
+        if not all(id(tag) in self.tin for tag in tags):
+            return None
+        # The deepest node of the first chain that contains every tag: binary search on the depth
+        low, high = 0, len(chain) - 1
+        if not all(self.is_ancestor(chain[low], tag) for tag in tags):
+            return None
+        while low < high:
+            middle = (low + high + 1) // 2
+            if all(self.is_ancestor(chain[middle], tag) for tag in tags):
+                low = middle
+            else:
+                high = middle - 1
+        # Strict ancestors only: when the deepest one is a tag of the list, take its parent
+        if any(chain[low] is tag for tag in tags):
+            return chain[low - 1] if low > 0 else None
+        return chain[low]
+
+
+def find_common_ancestor(item_tags, ancestor_index=None):
     # Check for invalid input, either an empty list of tags or tags without parents
     if len(item_tags) == 0 or len(item_tags[0]) == 0:
         raise ValueError('Invalid item tags')
-    # Create a list of sets, each containing all ancestors of each item_tag
-    ancestor_lists = [set(item_tag.parents) for item_tag, _ in item_tags]
-    # Find the intersection of all sets to get common ancestors for all provided tags
-    common_ancestors = set.intersection(*ancestor_lists)
-    # Find the closest common ancestor
-    closest_common_ancestor = None
-    max_depth = float('-inf')
-    base_node = item_tags[0][0].find_parent('body')
+    tags = [item_tag for item_tag, _ in item_tags]
+    if ancestor_index is None:
+        ancestor_index = AncestorIndex.from_tag(tags[0])
+    base_node = tags[0].find_parent('body')
     if base_node is None:
         raise ValueError('Invalid body tag')
-    # Iterate through each common ancestor to find the one closest to the item_tags
-    for ancestor in common_ancestors:
-        # Calculate the depth of the ancestor by comparing its distance from the 'body' tag
-        depth = len(list(ancestor.parents)) - len(list(base_node.parents))
-        if depth > max_depth:
-            closest_common_ancestor = ancestor
-            max_depth = depth
-    return closest_common_ancestor, max_depth + 1  # Adjust the calculated depth
+    # Find the closest common ancestor
+    closest_common_ancestor = ancestor_index.common_ancestor(tags)
+    if closest_common_ancestor is None:
+        return None, float('-inf')
+    # Calculate the depth of the ancestor by comparing its distance from the 'body' tag
+    depth = ancestor_index.depth[id(closest_common_ancestor)] - ancestor_index.depth[id(base_node)]
+    return closest_common_ancestor, depth + 1  # Adjust the calculated depth
 
 
-def calculate_distance_between_tags(html_tags):
+def calculate_distance_between_tags(html_tags, ancestor_index=None):
+    if ancestor_index is None and len(html_tags) > 0:
+        ancestor_index = AncestorIndex.from_tag(html_tags[0][0])
     char_counts = []
     for i in range(len(html_tags) - 1):
         tag1, tag2 = html_tags[i], html_tags[i + 1]
         # Find the closest common ancestor for each pair of tags
-        common_ancestor, _ = find_common_ancestor((tag1, tag2))
+        common_ancestor, _ = find_common_ancestor((tag1, tag2), ancestor_index)
         if common_ancestor is None:
             raise ValueError(f'Invalid ancestor for {tag1} and {tag2}')
-        # Extract all text between these two tags within the common ancestor
-        found_first = False
-        char_count = 0
-        # Iterate through descendants of the common ancestor to find the tags and count chars
-        for desc in common_ancestor.descendants:
-            if isinstance(desc, Tag) and check_same_tags(desc, tag1[0]):
-                found_first = True
-            elif isinstance(desc, Tag) and check_same_tags(desc, tag2[0]):
-                break
-            elif found_first and isinstance(desc, str):
-                char_count += len(desc)
-        char_counts.append(char_count)
+        # Count the text chars between the two tags from their offsets in the document
+        char_counts.append(ancestor_index.text_distance(tag1[0], tag2[0]))
     return char_counts
 
 
-def find_key_index(html_content, toc_tags_position, item_key, start_position=0):
-    item_value = ITEMS[item_key].lower()
-    item_value_no_space = item_value.replace(' ', '')
-    # First, try matching SYMBOL_TERMINATORS
-    terminator_pattern = r'(' + '|'.join(re.escape(terminator) for terminator in SYMBOL_TERMINATORS) + r')'
-    pattern = re.compile(
-        r'>\s*(' + re.escape(item_value) + r'|' + re.escape(item_value_no_space) + r')' + terminator_pattern)
-    matches = list(pattern.finditer(html_content.lower(), pos=start_position))
-    if len(matches) < 2:
-        # Try matching NON_SYMBOL_TERMINATORS
-        terminator_pattern = r'(' + '|'.join(re.escape(terminator) for terminator in NON_SYMBOL_TERMINATORS) + r')'
-        pattern = re.compile(
-            r'>\s*(' + re.escape(item_value) + r'|' + re.escape(item_value_no_space) + r')' + terminator_pattern)
-        matches += list(pattern.finditer(html_content.lower(), pos=start_position))
-    if len(matches) < 2:
-        # Try matching item_value with a negative lookahead to ensure no letters or digits follow
-        pattern = re.compile(
-            r'>\s*(' + re.escape(item_value) + r'|' + re.escape(item_value_no_space) + r')(?![a-zA-Z0-9])')
-        matches += list(pattern.finditer(html_content.lower(), pos=start_position))
-    # Sort matches by their start positions
-    matches = sorted(matches, key=lambda m: m.start())
-    if matches:
-        if toc_tags_position and start_position == 0 and len(matches) > 1:
-            return matches[1].start() + matches[1].group().find(item_value)
-        else:
-            return matches[0].start() + matches[0].group().find(item_value)
-    return -1
+class FilingIndex:
+    """
+    Offsets of every "Item N" header of a filing, computed with one lowercase copy and one regex scan.
+    For each item, header positions are kept per matching rule (symbol terminator, space terminator,
+    no alphanumeric character after), so `find_key_index` lookups are bisects instead of full-document scans.
+    """
+
+    HEADER_PATTERN = re.compile(r'>\s*item ?([1278])')
+
+    def __init__(self, html_content):
+        html_lower = html_content.lower()
+        self.length = len(html_content)
+        # item_key -> one (starts, offsets) pair per matching rule, in the order find_key_index tries them
+        self.headers = {item_key: [([], []) for _ in range(3)] for item_key in ITEMS}
+        item_patterns = {item_key: self._item_patterns(item_key) for item_key in ITEMS}
+        item_numbers = {item_key: ITEMS[item_key].lower().split(' ')[-1] for item_key in ITEMS}
+        for match in self.HEADER_PATTERN.finditer(html_lower):
+            position = match.start()
+            for item_key, patterns in item_patterns.items():
+                if not item_numbers[item_key].startswith(match.group(1)):
+                    continue
+                item_value = ITEMS[item_key].lower()
+                for (starts, offsets), pattern in zip(self.headers[item_key], patterns):
+                    item_match = pattern.match(html_lower, position)
+                    if item_match:
+                        starts.append(position)
+                        offsets.append(position + item_match.group().find(item_value))
+
+    @staticmethod
+    def _item_patterns(item_key):
+        item_value = ITEMS[item_key].lower()
+        item_value_no_space = item_value.replace(' ', '')
+        item_pattern = r'>\s*(' + re.escape(item_value) + r'|' + re.escape(item_value_no_space) + r')'
+        return [
+            re.compile(item_pattern + r'(' + '|'.join(re.escape(terminator) for terminator in SYMBOL_TERMINATORS) + r')'),
+            re.compile(item_pattern + r'(' + '|'.join(re.escape(terminator) for terminator in NON_SYMBOL_TERMINATORS) + r')'),
+            re.compile(item_pattern + r'(?![a-zA-Z0-9])'),
+        ]
+
+    def find_key_index(self, toc_tags_position, item_key, start_position=0):
+        # Same rules as a full scan: try symbol terminators first and fall back to the looser rules
+        # while fewer than two headers are found; only the first two headers after start_position matter
+        matches = []
+        n_matches = 0
+        for starts, offsets in self.headers[item_key]:
+            if n_matches >= 2:
+                break
+            i = bisect.bisect_left(starts, start_position)
+            n_matches += len(starts) - i
+            matches += zip(starts[i:i + 2], offsets[i:i + 2])
+        matches.sort(key=lambda m: m[0])
+        if matches:
+            if toc_tags_position and start_position == 0 and n_matches > 1:
+                return matches[1][1]
+            else:
+                return matches[0][1]
+        return -1
+
+
+def find_key_index(html_content, toc_tags_position, item_key, start_position=0, filing_index=None):
+    # Pass a FilingIndex built once per filing to avoid re-scanning the whole document on every call
+    if filing_index is None:
+        filing_index = FilingIndex(html_content)
+    return filing_index.find_key_index(toc_tags_position=toc_tags_position,
+                                       item_key=item_key,
+                                       start_position=start_position)
 
-def find_best_item_combination(html_content, debug=False, is_save=False):
+def find_best_item_combination(html_content, debug=False, is_save=False, parser=None):
 
-    soup = BeautifulSoup(html_content, 'html.parser')
+    soup = parse_html(html_content, parser)
     # Step 1
     # Dictionary to store results for each item
-    item_results = {}
-    for item_key, item_value in ITEMS.items():
-        results = []
-        # Find and store tags related to each item in the HTML
-        search_tags(soup.body, item_value, results)
-        item_results[item_key] = results
+    # Find and store tags related to each item in the HTML, all items in one pass
+    item_results = search_item_tags(soup.body)
+    ancestor_index = AncestorIndex(soup)
     if debug:
         print('Item Results:', item_results)
     # Step 2
@@ -217,15 +386,7 @@ def find_best_item_combination(html_content, debug=False, is_save=False):
             # Strategy: Only need to check the first 3 tags
             first_tags = [tags[0] for tags in non_empty_item_results.values()][:3]
             # last_tags = [tags[-1] for tags in non_empty_item_results.values()][:3]
-            # Assumption: If calculate_distance_between_tags takes too long to execute,
-            # it indicates that it is not a table of contents
-            timeout = 60
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                future = executor.submit(calculate_distance_between_tags, first_tags)
-                try:
-                    first_tags_distances = future.result(timeout=timeout)
-                except concurrent.futures.TimeoutError:
-                    first_tags_distances = []
+            first_tags_distances = calculate_distance_between_tags(first_tags, ancestor_index)
             avg_distance_first = (sum(first_tags_distances) / len(first_tags_distances)) if first_tags_distances else float('inf')
             if debug:
                 print('First Tags Distances:', first_tags_distances)
@@ -268,15 +429,15 @@ def find_best_item_combination(html_content, debug=False, is_save=False):
         best_combination_indices = []
         common_ancestor = None
         if non_empty_item_results:
-            for combination in itertools.product(*non_empty_item_results.values()):
-                common_ancestor, ancestor_depth = find_common_ancestor(combination)
+            for indexed_combination in itertools.product(*[list(enumerate(tags)) for tags in non_empty_item_results.values()]):
+                combination_indices, combination = zip(*indexed_combination)
+                common_ancestor, ancestor_depth = find_common_ancestor(combination, ancestor_index)
                 # Check if this common ancestor is deeper than the previously found ancestors
                 if common_ancestor and ancestor_depth > max_ancestor_depth:
                     max_ancestor_depth = ancestor_depth
                     # Store the indices of the best combination
                     # where the best combination is defined by deepest common ancestor
-                    best_combination_indices = [non_empty_item_results[key].index(html_tag) for key, html_tag in
-                                                zip(non_empty_item_results.keys(), combination)]
+                    best_combination_indices = list(combination_indices)
         # Dictionary to store item combination
         item_combination = {}
         for key in non_empty_item_results:
@@ -294,7 +455,9 @@ def find_best_item_combination(html_content, debug=False, is_save=False):
     return part_best_combinations, part_depths, part_ancestors, html_content, toc_tags_position
 
 
-def extract_item_content(html_content, item_key, item_combination, part_depth, next_part_depth, toc_tags_position, debug=False):
+def extract_item_content(html_content, item_key, item_combination, part_depth, next_part_depth, toc_tags_position, debug=False,
+                         filing_index=None, as_text=False, parser=None):
+    # as_text: return the item text, read from the parsed tags instead of re-parsing the item html
     if item_key not in ITEMS:
         raise ValueError('Invalid item key')
     if item_combination[item_key] is None:
@@ -335,22 +498,30 @@ def extract_item_content(html_content, item_key, item_combination, part_depth, n
                     end_tag_depth -= 1
     # Build the content string starting from the start_tag and including siblings until end_tag
     content = ''
+    item_tags = []
+    is_direct_content = False
     if start_tag is not None:
+        if filing_index is None:
+            filing_index = FilingIndex(html_content)
         start_tag_index = find_key_index(html_content=html_content,
                                          toc_tags_position=toc_tags_position,
-                                         item_key=item_key)
+                                         item_key=item_key,
+                                         filing_index=filing_index)
         if debug:
             print('Start Tag Index:', start_tag_index,
                   'Table of Contents Position:', 'Begin' if toc_tags_position else 'End', 'Item:', item_key)
         content += str(start_tag)
+        item_tags.append(start_tag)
         content_tags = start_tag.find_next_siblings()
         if end_tag is None:
             content += ''.join(map(str, content_tags))
+            item_tags += content_tags
             # Handle case where there's another 'Item 1' at the end (table of contents)
             end_tag_index = find_key_index(html_content=html_content,
                                            toc_tags_position=toc_tags_position,
                                            item_key='item1',
-                                           start_position=start_tag_index)
+                                           start_position=start_tag_index,
+                                           filing_index=filing_index)
             if end_tag_index == -1:
                 end_tag_index = len(html_content)
         else:
@@ -358,10 +529,12 @@ def extract_item_content(html_content, item_key, item_combination, part_depth, n
                 if temp_tag == end_tag:
                     break
                 content += str(temp_tag)
+                item_tags.append(temp_tag)
             end_tag_index = find_key_index(html_content=html_content,
                                            toc_tags_position=toc_tags_position,
                                            item_key=next_item_key,
-                                           start_position=start_tag_index)
+                                           start_position=start_tag_index,
+                                           filing_index=filing_index)
             if debug:
                 print('End Tag Index:', end_tag_index, 'TOC Tags Position:', toc_tags_position, 'Item:', next_item_key)
             if end_tag_index == -1:
@@ -374,6 +547,7 @@ def extract_item_content(html_content, item_key, item_combination, part_depth, n
             if debug:
                 print('* Direct Content Length:', len(direct_content), ', Content Length:', len(content))
             content = direct_content
+            is_direct_content = True
         # Assumption: If len(content) is too short,
         # it indicates that the content indeed contains title content only
         min_content_length = 500
@@ -381,20 +555,28 @@ def extract_item_content(html_content, item_key, item_combination, part_depth, n
             if debug:
                 print('* Direct Content Length:', len(direct_content), ', Content Length:', len(content))
             content = direct_content
+            is_direct_content = True
         # Assumption: len(content) and len(direct_content) are similar
         max_extra_content_length = 2000
         if abs(len(content) - len(direct_content)) > max_extra_content_length:
             if debug:
                 print('* Direct Content Length:', len(direct_content), ', Content Length:', len(content))
             content = direct_content
+            is_direct_content = True
+    if as_text:
+        if is_direct_content:
+            return parse_html(content, parser).text
+        return ''.join(tag.get_text() for tag in item_tags)
     return content
 
-def extract_from_html(html_content, debug=False, is_save=False):
+def extract_from_html(html_content, debug=False, is_save=False, parser=None, as_text=False, item_keys=None):
+    # item_keys: only extract these items (all of them by default)
 
     part_best_combinations, part_depths, part_ancestors, html_content, toc_tags_position = find_best_item_combination(
         html_content=html_content,
         debug=debug,
-        is_save=is_save)
+        is_save=is_save,
+        parser=parser)
     if debug:
         print('Part Combinations:', part_best_combinations)
         print('Part Depths:', part_depths)
@@ -403,6 +585,7 @@ def extract_from_html(html_content, debug=False, is_save=False):
         item_combination.update(part_combination)
     if debug:
         print('Item Combination:', item_combination)
+    filing_index = FilingIndex(html_content)
     item_lengths = {}
     for part_key, part_combination in part_best_combinations.items():
         part_depth = part_depths[part_key]
@@ -411,25 +594,24 @@ def extract_from_html(html_content, debug=False, is_save=False):
         if next_part_key is not None:
             next_part_depth = part_depths[next_part_key]
         for item_key, item_info in part_combination.items():
+            if item_keys is not None and item_key not in item_keys:
+                continue
             item_content = extract_item_content(html_content=html_content,
                                                 item_key=item_key,
                                                 item_combination=item_combination,
                                                 part_depth=part_depth,
                                                 next_part_depth=next_part_depth,
                                                 toc_tags_position=toc_tags_position,
-                                                debug=debug)
+                                                debug=debug,
+                                                filing_index=filing_index,
+                                                as_text=as_text,
+                                                parser=parser)
             item_lengths[item_key] = item_content
     return item_lengths
 
 
-def extract_items(html_content):
-    item_outs = extract_from_html(html_content)
-    output_dict = {}
-    for key, value in item_outs.items():
-        if key in ['item1', 'item1a', 'item7']:
-            content = BeautifulSoup(item_outs[key], 'html.parser').text
-            output_dict[key] = content
-    return output_dict
+def extract_items(html_content, parser=None):
+    return extract_from_html(html_content, parser=parser, as_text=True, item_keys=['item1', 'item1a', 'item7'])
 
 
 if __name__ == '__main__':
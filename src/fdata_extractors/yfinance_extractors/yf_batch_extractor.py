@@ -0,0 +1,79 @@
+from src.config.config import YAHOO_RATE_LIMIT
+from src.fdata_extractors.rate_limiter import get_rate_limiter
+from typing import Dict, List
+import yfinance as yf
+import pandas as pd
+import yahooquery
+
+
+class YFinanceBatchAnalyzer:
+    """
+    Retrieve market data for many tickers at once.
+    Summary fields come from a single Yahoo quote request and closing prices from one bulk download,
+    instead of one `info` + one `history` call per ticker.
+
+    Values match the per-ticker path (YFinanceAnalyzer.info / get_price):
+    - Quote fields come from the v7 quote endpoint, which yfinance also merges into `info` over the quoteSummary modules.
+      dividendYield is therefore in percent (0.44 for 0.44 %) on both paths, not the 0.0044 fraction of summaryDetail
+    - currentPrice is the quote's regularMarketPrice, the price `info` reports as currentPrice (financialData)
+    - The 1y low / high use auto-adjusted closes, like `history()` and `get_price`
+    """
+
+    # output column -> Yahoo v7 quote field
+    QUOTE_FIELDS = {
+        'trailingPE': 'trailingPE',
+        'currentPrice': 'regularMarketPrice',
+        'bookValue': 'bookValue',
+        'dividendYield': 'dividendYield',
+        'marketCap': 'marketCap',
+    }
+
+    def __init__(self, tickers: List[str]):
+        """
+        Parameters:
+        tickers (list[str]): Stock tickers, e.g. ["NVDA", "AMD", "INTC"]. Duplicates are dropped.
+        """
+        self.tickers = list(dict.fromkeys(tickers))
+        self.rate_limiter = get_rate_limiter('yahoo', rate=YAHOO_RATE_LIMIT)
+
+    def get_quotes(self) -> pd.DataFrame:
+        """Summary fields for every ticker in one request (index: ticker, columns: QUOTE_FIELDS keys)."""
+        self.rate_limiter.acquire()
+        quotes = yahooquery.Ticker(self.tickers).quotes
+        if not isinstance(quotes, dict):
+            quotes = {}
+        rows = {}
+        for ticker in self.tickers:
+            quote = quotes.get(ticker)
+            quote = quote if isinstance(quote, dict) else {}
+            rows[ticker] = {col: quote.get(field) for col, field in self.QUOTE_FIELDS.items()}
+        return pd.DataFrame.from_dict(rows, orient='index', columns=list(self.QUOTE_FIELDS))
+
+    def get_prices(self, period: str = "1y", interval: str = "1d") -> pd.DataFrame:
+        """Closing prices for every ticker in one bulk download (index: date, columns: ticker)."""
+        self.rate_limiter.acquire()
+        hist = yf.download(self.tickers,
+                           period=period,
+                           interval=interval,
+                           group_by='column',
+                           auto_adjust=True, # same adjustment as YFinanceAnalyzer.get_price
+                           progress=False)
+        close = hist['Close']
+        if isinstance(close, pd.Series):
+            close = close.to_frame(name=self.tickers[0])
+        return close.reindex(columns=self.tickers)
+
+    def get_summary(self, period: str = "1y", interval: str = "1d") -> pd.DataFrame:
+        """
+        Columnar comparison frame: quote fields plus the low / high close over `period`, one row per ticker.
+        Missing values are None.
+        """
+        prices = self.get_prices(period=period, interval=interval)
+        summary = self.get_quotes()
+        summary['one_year_low'] = prices.min()
+        summary['one_year_high'] = prices.max()
+        return summary.astype(object).where(summary.notna(), None)
+
+    def get_summary_records(self, period: str = "1y", interval: str = "1d") -> Dict[str, Dict]:
+        """`get_summary` as {ticker: {field: value}}."""
+        return self.get_summary(period=period, interval=interval).to_dict(orient='index')
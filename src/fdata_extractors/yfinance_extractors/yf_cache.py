@@ -0,0 +1,155 @@
+from src.config.config import CACHE_DIR, YFINANCE_OFFLINE, YAHOO_RATE_LIMIT
+from src.fdata_extractors.rate_limiter import get_rate_limiter
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Optional, Union
+import pandas as pd
+import hashlib
+import json
+import os
+import time
+import warnings
+
+
+class YFinanceCache:
+    """
+    Content-addressed on-disk cache for yfinance datasets.
+
+    Each entry is keyed on (ticker, dataset, frequency) and stored as a Parquet file (frames / series)
+    or a JSON file (dicts such as `info`), next to a small metadata file holding its expiry time.
+    """
+
+    ## Default time-to-live per dataset family. Statements are also refreshed at the next earnings date when it comes sooner.
+    PRICE_TTL = timedelta(minutes=15)
+    INFO_TTL = timedelta(days=1)
+    STATEMENT_TTL = timedelta(days=7) # also catches a quarter Yahoo publishes days after the earnings date
+
+    def __init__(self,
+                 cache_dir: Union[str, Path] = CACHE_DIR / 'yfinance',
+                 offline: bool = YFINANCE_OFFLINE):
+        """
+        Parameters:
+        cache_dir (str | Path): Directory holding the cached entries.
+        offline (bool): Never hit the network; serve cached entries regardless of their age.
+        """
+        self.cache_dir = Path(cache_dir)
+        self.offline = offline
+        self.rate_limiter = get_rate_limiter('yahoo', rate=YAHOO_RATE_LIMIT)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def _key(ticker: str, dataset: str, frequency: str) -> str:
+        return hashlib.sha256(f"{ticker.upper()}|{dataset}|{frequency}".encode()).hexdigest()
+
+    def _paths(self, key: str):
+        return self.cache_dir / f"{key}.meta.json", self.cache_dir / f"{key}.parquet", self.cache_dir / f"{key}.json"
+
+    @staticmethod
+    def _atomic_write(path: Path, writer: Callable[[Path], None]):
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            writer(tmp_path)
+            os.replace(tmp_path, path)
+        finally:
+            if tmp_path.exists():
+                tmp_path.unlink()
+
+    def _read(self, key: str) -> Optional[tuple]:
+        meta_path, parquet_path, json_path = self._paths(key)
+        if not meta_path.exists():
+            return None
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            if meta['kind'] == 'dict':
+                with open(json_path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+            else:
+                data = pd.read_parquet(parquet_path)
+                if meta['kind'] == 'series':
+                    data = data.iloc[:, 0]
+        except (OSError, ValueError, KeyError):
+            return None
+        return data, meta
+
+    def _write(self, key: str, data: Any, meta: dict):
+        meta_path, parquet_path, json_path = self._paths(key)
+        try:
+            if isinstance(data, dict):
+                meta['kind'] = 'dict'
+                self._atomic_write(json_path, lambda p: p.write_text(json.dumps(data, default=str), encoding='utf-8'))
+            elif isinstance(data, pd.Series):
+                meta['kind'] = 'series'
+                frame = data.to_frame(name=str(data.name) if data.name is not None else 'value')
+                self._atomic_write(parquet_path, lambda p: frame.to_parquet(p))
+            else:
+                meta['kind'] = 'frame'
+                self._atomic_write(parquet_path, lambda p: data.to_parquet(p))
+            self._atomic_write(meta_path, lambda p: p.write_text(json.dumps(meta), encoding='utf-8'))
+        except Exception as e:
+            warnings.warn(f"[{self.__class__.__name__}._write] Could not cache {meta['ticker']} {meta['dataset']}: {e}")
+
+    def get(self,
+            ticker: str,
+            dataset: str,
+            frequency: str,
+            fetcher: Callable[[], Any],
+            ttl: Optional[timedelta] = None,
+            expires_at: Optional[Callable[[], Optional[datetime]]] = None) -> Any:
+        """
+        Return the cached dataset if it is still fresh, otherwise call `fetcher` and cache its result.
+
+        ttl: maximum age of the fetched entry, STATEMENT_TTL by default.
+        expires_at: callable returning an earlier expiry (e.g. the next earnings date) or None.
+            It is only called after a fetch, so a fresh entry costs nothing more.
+        In offline mode the cached entry is returned whatever its age; a missing entry raises FileNotFoundError.
+        If fetching fails, a stale entry is served instead of failing the report.
+        """
+        key = self._key(ticker, dataset, frequency)
+        cached = self._read(key)
+        if cached is not None:
+            data, meta = cached
+            if self.offline or meta['expires_at'] > time.time():
+                return data
+        elif self.offline:
+            raise FileNotFoundError(
+                f"[{self.__class__.__name__}.get] Offline mode: no cached {dataset} ({frequency}) for {ticker}."
+            )
+
+        try:
+            self.rate_limiter.acquire()
+            data = fetcher()
+        except Exception as e:
+            if cached is None:
+                raise
+            warnings.warn(f"[{self.__class__.__name__}.get] Serving stale {dataset} ({frequency}) for {ticker}: {e}")
+            return cached[0]
+
+        now = time.time()
+        expiry = datetime.fromtimestamp(now) + (ttl if ttl is not None else self.STATEMENT_TTL)
+        if expires_at is not None:
+            try:
+                earlier = expires_at()
+            except Exception as e:
+                warnings.warn(f"[{self.__class__.__name__}.get] No expiry for {dataset} ({frequency}) of {ticker}, using the ttl: {e}")
+                earlier = None
+            if earlier is not None:
+                expiry = min(expiry, earlier)
+        self._write(key, data, {
+            'ticker': ticker.upper(),
+            'dataset': dataset,
+            'frequency': frequency,
+            'fetched_at': now,
+            'expires_at': expiry.timestamp(),
+        })
+        return data
+
+    @classmethod
+    def next_earnings_date(cls, info: dict) -> Optional[datetime]:
+        """Earliest upcoming earnings timestamp reported in yfinance `info`, if any."""
+        now = time.time()
+        timestamps = [info.get(k) for k in ('earningsTimestampStart', 'earningsTimestamp', 'earningsTimestampEnd')]
+        upcoming = [ts for ts in timestamps if isinstance(ts, (int, float)) and ts > now]
+        if not upcoming:
+            return None
+        return datetime.fromtimestamp(min(upcoming))
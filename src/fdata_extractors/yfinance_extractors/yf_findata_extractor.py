@@ -1,5 +1,8 @@
 from src.fdata_extractors.findata_validator import FinDataValidator
-from src.fdata_extractors.decorator import apply_selection, apply_selection_growth
+from src.fdata_extractors.decorator import apply_selection, apply_selection_growth, normalize_fdata
+from src.fdata_extractors.yfinance_extractors.yf_cache import YFinanceCache
+from functools import cached_property
+from typing import Dict, Optional, Tuple
 import yfinance as yf
 import pandas as pd
 import yahooquery
@@ -11,23 +14,47 @@ class YFinanceAnalyzer(FinDataValidator):
     Each metric is exposed through its own method for clarity and flexibility.
     """
 
-    def __init__(self, ticker: str):
+    def __init__(self, ticker: str, cache: Optional[YFinanceCache] = None):
         """
-        Initialize with a ticker symbol.
+        Initialize with a ticker symbol. Nothing is fetched here: every attribute below is loaded on first access.
 
         Parameters:
         ticker (str): The stock ticker, e.g. "AAPL".
+        cache (YFinanceCache): On-disk cache for Yahoo datasets, a default one is created if not provided.
         """
         super().__init__()
-        self.query_ticker = yahooquery.Ticker(ticker)
-        self.ticker = yf.Ticker(ticker)
-        self.info = self.ticker.info
-        # Quarterly income statement and financials
-        self.quarterly_income = self.ticker.quarterly_income_stmt
-        self.quarterly_financials = self.ticker.quarterly_financials
+        self.symbol = ticker
+        self.cache = cache if cache is not None else YFinanceCache()
+        # Normalized statements keyed on (statement, frequency), shared by the level and growth getters
+        self._statements: Dict[Tuple[str, str], pd.DataFrame] = {}
 
-        # S&P 500 index ticker for market metrics
-        self.market_ticker = yf.Ticker("^GSPC")
+    @cached_property
+    def ticker(self) -> yf.Ticker:
+        return yf.Ticker(self.symbol)
+
+    @cached_property
+    def query_ticker(self) -> yahooquery.Ticker:
+        return yahooquery.Ticker(self.symbol)
+
+    @cached_property
+    def info(self) -> dict:
+        return self.cache.get(self.symbol, 'info', 'snapshot',
+                              fetcher=lambda: self.ticker.info,
+                              ttl=YFinanceCache.INFO_TTL)
+
+    # Quarterly income statement and financials
+    @cached_property
+    def quarterly_income(self) -> pd.DataFrame:
+        return self._get_raw_statement('income_stmt', quarterly=True).T
+
+    @cached_property
+    def quarterly_financials(self) -> pd.DataFrame:
+        return self._get_raw_statement('financials', quarterly=True).T
+
+    # S&P 500 index ticker for market metrics
+    @cached_property
+    def market_ticker(self) -> yf.Ticker:
+        return yf.Ticker("^GSPC")
 
     def get_price(self, period: str = "1mo", interval: str = "1d") -> pd.Series:
         """
@@ -36,8 +63,38 @@ class YFinanceAnalyzer(FinDataValidator):
         period: yfinance_extractors period string (e.g., '5d', '1mo', '1y').
         interval: data interval (e.g., '1d', '1h').
         """
-        hist = self.ticker.history(period=period, interval=interval)
-        return hist["Close"]
+        return self.cache.get(self.symbol, 'close', f"{period}_{interval}",
+                              fetcher=lambda: self.ticker.history(period=period, interval=interval, auto_adjust=True)["Close"],
+                              ttl=YFinanceCache.PRICE_TTL)
+
+    def _get_raw_statement(self, statement: str, quarterly: bool) -> pd.DataFrame:
+        """
+        Get a financial statement (dates as index, line items as columns) through the on-disk cache.
+        Statements stay cached for STATEMENT_TTL, or until the next earnings date when it comes sooner.
+
+        statement: yf.Ticker statement attribute without the `quarterly_` prefix, e.g. 'income_stmt', 'balance_sheet'.
+        """
+        attr = f"quarterly_{statement}" if quarterly else statement
+        return self.cache.get(self.symbol, statement, 'quarterly' if quarterly else 'yearly',
+                              fetcher=lambda: getattr(self.ticker, attr).T,
+                              expires_at=lambda: YFinanceCache.next_earnings_date(self.info))
+
+    def _get_statement(self, statement: str, n_years: int = None, n_quarters: int = None) -> pd.DataFrame:
+        """
+        Get a normalized, date-sorted financial statement from the per-analyzer statement store.
+        The statement is fetched and normalized once per frequency; level and growth getters slice the same frame.
+        """
+        if n_years is not None:
+            quarterly = False
+        elif n_quarters is not None:
+            quarterly = True
+        else:
+            return pd.DataFrame()
+
+        key = (statement, 'quarterly' if quarterly else 'yearly')
+        if key not in self._statements:
+            self._statements[key] = normalize_fdata(self._get_raw_statement(statement, quarterly=quarterly).sort_index())
+        return self._statements[key]
 
     @apply_selection
     def get_past_income_statement(self,
@@ -49,13 +106,7 @@ class YFinanceAnalyzer(FinDataValidator):
             selected_columns: list of column to return
         """
 
-        if n_years is not None:
-            df = self.ticker.income_stmt.T
-        elif n_quarters is not None:
-            df = self.ticker.quarterly_income_stmt.T
-        else:
-            return pd.DataFrame()
-        return df.sort_index()
+        return self._get_statement('income_stmt', n_years=n_years, n_quarters=n_quarters)
 
     @apply_selection
     def get_past_balance_sheet(self,
@@ -66,13 +117,7 @@ class YFinanceAnalyzer(FinDataValidator):
             n_years / n_quarters (max4): number of years data to return / number of quarters to return
             selected_columns: list of column to return
         """
-        if n_years is not None:
-            df = self.ticker.balance_sheet.T
-        elif n_quarters is not None:
-            df = self.ticker.quarterly_balance_sheet.T
-        else:
-            return pd.DataFrame()
-        return df.sort_index()
+        return self._get_statement('balance_sheet', n_years=n_years, n_quarters=n_quarters)
 
     @apply_selection
     def get_past_cash_flow(self,
@@ -83,13 +128,7 @@ class YFinanceAnalyzer(FinDataValidator):
             n_years / n_quarters (max4): number of years data to return / number of quarters to return
             selected_columns: list of column to return
         """
-        if n_years is not None:
-            df = self.ticker.cash_flow.T
-        elif n_quarters is not None:
-            df = self.ticker.quarterly_cash_flow.T
-        else:
-            return pd.DataFrame()
-        return df.sort_index()
+        return self._get_statement('cash_flow', n_years=n_years, n_quarters=n_quarters)
 
     @apply_selection_growth
     def get_past_income_statement_growth(self,
@@ -100,13 +139,7 @@ class YFinanceAnalyzer(FinDataValidator):
             n_years / n_quarters (max4): number of years data to return / number of quarters to return
             selected_columns: list of column to return
         """
-        if n_years is not None:
-            df = self.ticker.income_stmt.T
-        elif n_quarters is not None:
-            df = self.ticker.quarterly_income_stmt.T
-        else:
-            return pd.DataFrame()
-        return df.sort_index()
+        return self._get_statement('income_stmt', n_years=n_years, n_quarters=n_quarters)
 
     @apply_selection_growth
     def get_past_balance_sheet_growth(self,
@@ -117,13 +150,7 @@ class YFinanceAnalyzer(FinDataValidator):
             n_years / n_quarters (max4): number of years data to return / number of quarters to return
             selected_columns: list of column to return
         """
-        if n_years is not None:
-            df = self.ticker.balance_sheet.T
-        elif n_quarters is not None:
-            df = self.ticker.quarterly_balance_sheet.T
-        else:
-            return pd.DataFrame()
-        return df.sort_index()
+        return self._get_statement('balance_sheet', n_years=n_years, n_quarters=n_quarters)
 
     @apply_selection_growth
     def get_past_cash_flow_growth(self,
@@ -134,13 +161,7 @@ class YFinanceAnalyzer(FinDataValidator):
             n_years / n_quarters (max4): number of years data to return / number of quarters to return
             selected_columns: list of column to return
         """
-        if n_years is not None:
-            df = self.ticker.cash_flow.T
-        elif n_quarters is not None:
-            df = self.ticker.quarterly_cash_flow.T
-        else:
-            return pd.DataFrame()
-        return df.sort_index()
+        return self._get_statement('cash_flow', n_years=n_years, n_quarters=n_quarters)
 
     # def get_past_yearly_income_statement(self) -> pd.DataFrame:
     #     """Get yearly income statement data"""
@@ -1,8 +1,10 @@
 from src.report.agent.tool import *
 from .agent_utils import *
 from .agent_teams import *
+from .section_store import SectionStore
 
 __all__ = [
+    'ReportDataContext',
     'ToolsHelper',
     'AgentTools',
     'HumanTools',
@@ -11,4 +13,5 @@ __all__ = [
     'FVPDTeam',
     'AgentTeamUtils',
     'AgentWorkflowUtils',
+    'SectionStore',
 ]
\ No newline at end of file
@@ -6,7 +6,8 @@ from src.report.agent.hub import (
 from src.report.agent import (
     State,
     AgentTeamUtils,
-    AgentTools
+    AgentTools,
+    ReportDataContext
 )
 from src.report.llm import OPENAI_CALLER
 from src.report.decorator import AgentDecorator
@@ -16,6 +17,8 @@ from langgraph.prebuilt import create_react_agent
 from langchain_core.messages import HumanMessage, trim_messages, AIMessage
 from langgraph.types import Command
 from langgraph.graph import StateGraph, MessagesState, START, END
+import hashlib
+import json
 
 class ReportTeamBase(AgentTeamABC,
                      AgentTools,
@@ -36,21 +39,87 @@ class ReportTeamBase(AgentTeamABC,
     EVALUATOR_INSTRU:        str
     EVAL2ASSIST_INSTRU:      str
 
-    def __init__(self, ticker:str, year:str, quarter:str):
-        super().__init__(ticker=ticker, year=year, quarter=quarter)
+    def __init__(self, ticker:str, year:str, quarter:str, data_context: Optional[ReportDataContext] = None):
+        super().__init__(ticker=ticker, year=year, quarter=quarter, data_context=data_context)
 
         self.openai_llm = OPENAI_CALLER()._get_llm()
         tools_list = self._get_tools()
         self.tools_used = [tools_list[i] for i in self.DATA_TOOLS]
 
-    def team_supervisor_node(self, state: State):
-        assistants = [self.ASSISTANT_NAME]
-        options = ["FINISH"] + assistants
+        ## Build the routers and agents once, every node visit reuses them
+        self.supervisor_router = self._build_supervisor_router()
+        self.evaluator_router = self._build_evaluator_router()
+        self.writer_router = self._build_writer_router()
+        self.supervisor_llm = self.openai_llm.with_structured_output(self.supervisor_router)
+        self.evaluator_agent = create_react_agent(self.openai_llm,
+                                                  response_format=self.evaluator_router,
+                                                  tools=self.tools_used)
+        self.writer_agent = create_react_agent(self.openai_llm,
+                                               response_format=self.writer_router,
+                                               tools=self.tools_used)
+
+    ## ---------------------------------------------------- Input fingerprint ---------------------------------------------------- ##
+    def input_fingerprints(self) -> Optional[Dict[str, str]]:
+        """Fingerprint of every dataset behind the team's DATA_TOOLS, None if one of them can not be loaded."""
+        datasets = sorted({dataset for tool_name in self.DATA_TOOLS for dataset in self.TOOL_DATASETS[tool_name]})
+        try:
+            return {dataset: self.data_context.fingerprint(dataset) for dataset in datasets}
+        except Exception:
+            return None
+
+    def section_fingerprint(self, inputs: Optional[Dict[str, str]]) -> Optional[str]:
+        """
+        Fingerprint of everything the written section depends on: report key, model, prompts and input datasets.
+        None (never matches a stored section) when the inputs are unknown.
+        """
+        if inputs is None:
+            return None
+        payload = {
+            'team': self.TEAM_NAME,
+            'key': [self.ticker, self.year, self.quarter],
+            'model': getattr(self.openai_llm, 'model_name', None),
+            'prompts': [self.SECTION, self.TEAM_DESC, self.ASSISTANT_INSTRU, self.PROMPT_DESCRIPTION,
+                        self.PROMPT_TOOLS_STR, self.PROMPT_DELIVERABLE, self.EVALUATOR_INSTRU, self.EVAL2ASSIST_INSTRU],
+            'inputs': inputs,
+        }
+        return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode()).hexdigest()
+
+    def _build_supervisor_router(self):
+        options = ["FINISH", self.ASSISTANT_NAME]
 
         class Router(TypedDict):
             """Worker to route to next. If no workers needed, route to FINISH."""
             next: Literal[*options]
             plan: str
+        return Router
+
+    def _build_evaluator_router(self):
+        ROUTE_TO = [self.ASSISTANT_NAME]
+
+        class Router(TypedDict):
+            """
+            1. Worker to route to next.
+            2. Provide feedback to your colleagues
+            """
+            next: Literal[*ROUTE_TO]
+            feedback: str
+        return Router
+
+    def _build_writer_router(self):
+        ROUTE_TO = [self.EVALUATOR_NAME, self.TEAM_SUPERVISOR_NAME]
+
+        class Router(TypedDict):
+            """
+            1. Worker to route to next.
+            2. Written Section written by the assistant.
+            """
+            next: Literal[*ROUTE_TO]
+            written_section: str
+        return Router
+
+    ## ---------------------------------------------------- Team Supervisor ---------------------------------------------------- ##
+    def _supervisor_call(self, state: State):
+        assistants = [self.ASSISTANT_NAME]
 
         system_prompt = self.TEAM_DESC.format(year=self.year,
                                               quarter=self.quarter,
@@ -64,7 +133,9 @@ class ReportTeamBase(AgentTeamABC,
         messages = [
                        {"role": "system", "content": system_prompt},
                    ] + state["messages"]
-        response = self.openai_llm.with_structured_output(Router).invoke(messages)
+        return self.supervisor_llm, messages
+
+    def _supervisor_command(self, response) -> Command:
         goto = response["next"]
         plan = response["plan"]
         if goto == "FINISH":
@@ -76,35 +147,30 @@ class ReportTeamBase(AgentTeamABC,
                            "messages": [HumanMessage(content=plan, name=self.TEAM_SUPERVISOR_NAME, team_name=self.TEAM_NAME)]
                        })
 
+    def team_supervisor_node(self, state: State):
+        supervisor, messages = self._supervisor_call(state)
+        return self._supervisor_command(supervisor.invoke(messages))
 
-    def evaluator_node(self, state: State):
-        ROUTE_TO = [self.ASSISTANT_NAME]
-
-        class Router(TypedDict):
-            """
-            1. Worker to route to next.
-            2. Provide feedback to your colleagues
-            """
-            next: Literal[*ROUTE_TO]
-            feedback: str
+    async def ateam_supervisor_node(self, state: State):
+        supervisor, messages = self._supervisor_call(state)
+        return self._supervisor_command(await supervisor.ainvoke(messages))
 
+    ## ---------------------------------------------------- Evaluator ---------------------------------------------------- ##
+    def _evaluator_call(self, state: State):
         writer_msg = self._get_msg_content(state, self.ASSISTANT_NAME, self.TEAM_NAME)
         supervisor_msg = self._get_msg_content(state, self.TEAM_SUPERVISOR_NAME, self.TEAM_NAME)
 
         system_prompt = self.EVALUATOR_INSTRU.format(section=self.SECTION,
                                                    assistant_name=self.ASSISTANT_NAME,
-                                                   data_tools=self.tools_used,
+                                                   data_tools=[tool.name for tool in self.tools_used],
                                                    writer_msg=writer_msg,
                                                    supervisor_msg=supervisor_msg)
         messages = {
             'messages':[{"role": "system", "content": system_prompt}]
         }
+        return self.evaluator_agent, messages, writer_msg
 
-        evaluator_agent = create_react_agent(self.openai_llm,
-                                                 response_format=Router,
-                                                 tools=self.tools_used)
-
-        result = evaluator_agent.invoke(messages)
+    def _evaluator_command(self, result, writer_msg: str) -> Command:
         goto = result["structured_response"]["next"]
         feedback = result["structured_response"]["feedback"]
         feedback = (f"The {self.EVALUATOR_NAME}'s feedback is: \n\n<START>\n{feedback}\n<END>"
@@ -121,20 +187,16 @@ class ReportTeamBase(AgentTeamABC,
             }
         )
 
-    def writer_node(self, state: State):
+    def evaluator_node(self, state: State):
+        evaluator_agent, messages, writer_msg = self._evaluator_call(state)
+        return self._evaluator_command(evaluator_agent.invoke(messages), writer_msg)
 
-        ROUTE_TO = [self.EVALUATOR_NAME, self.TEAM_SUPERVISOR_NAME]
-        class Router(TypedDict):
-            """
-            1. Worker to route to next.
-            2. Written Section written by the assistant.
-            """
-            next: Literal[*ROUTE_TO]
-            written_section: str
+    async def aevaluator_node(self, state: State):
+        evaluator_agent, messages, writer_msg = self._evaluator_call(state)
+        return self._evaluator_command(await evaluator_agent.ainvoke(messages), writer_msg)
 
-        writer_agent = create_react_agent(self.openai_llm,
-                                          response_format=Router,
-                                          tools=self.tools_used)
+    ## ---------------------------------------------------- Writer ---------------------------------------------------- ##
+    def _writer_call(self, state: State):
         last_msg_from_team = self._get_last_message_for_team(messages=state["messages"], target_team=self.TEAM_NAME)
         msg_content = last_msg_from_team.content + "\n\n" + self.ASSISTANT_INSTRU
         prompt = {
@@ -142,8 +204,9 @@ class ReportTeamBase(AgentTeamABC,
                 {"role": "system", "content": msg_content}
             ]
         }
+        return self.writer_agent, prompt
 
-        result = writer_agent.invoke(prompt)
+    def _writer_command(self, result, state: State) -> Command:
         written_section = result["structured_response"]["written_section"]
 
         # check if evaluator has already run
@@ -163,6 +226,14 @@ class ReportTeamBase(AgentTeamABC,
             goto=goto,
         )
 
+    def writer_node(self, state: State):
+        writer_agent, prompt = self._writer_call(state)
+        return self._writer_command(writer_agent.invoke(prompt), state)
+
+    async def awriter_node(self, state: State):
+        writer_agent, prompt = self._writer_call(state)
+        return self._writer_command(await writer_agent.ainvoke(prompt), state)
+
 @AgentDecorator.inject_literal_annotations
 class BSOTeam(ReportTeamBase):
     # EXECUTIVE_DIRECTOR_NAME = SUP_HUB['company']['name']
@@ -251,3 +322,25 @@ class CATeam(ReportTeamBase):
     PROMPT_DELIVERABLE      = SUP_HUB[TEAM].prompt_section_deliverable
     EVALUATOR_INSTRU        = EVALUATION_HUB.evaluator_instruction
     EVAL2ASSIST_INSTRU      = EVALUATION_HUB.evaluator2assistant_instruction
+
+
+if __name__ == '__main__':
+    ## Micro-benchmark: per-node overhead of building the agents on every visit (previous behaviour) vs. reusing them
+    import time
+
+    team = BSOTeam(ticker='NVDA', year=2025, quarter=1)
+    n_visits = 20
+
+    start = time.perf_counter()
+    for _ in range(n_visits):
+        team.openai_llm.with_structured_output(team._build_supervisor_router())
+        create_react_agent(team.openai_llm, response_format=team._build_evaluator_router(), tools=team.tools_used)
+        create_react_agent(team.openai_llm, response_format=team._build_writer_router(), tools=team.tools_used)
+    end = time.perf_counter()
+    print(f"[rebuild] per-visit overhead: {(end - start) / n_visits * 1000:.3f} ms")
+
+    start = time.perf_counter()
+    for _ in range(n_visits):
+        team.supervisor_llm, team.evaluator_agent, team.writer_agent
+    end = time.perf_counter()
+    print(f"[reuse] per-visit overhead: {(end - start) / n_visits * 1000:.3f} ms")
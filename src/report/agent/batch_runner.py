@@ -0,0 +1,214 @@
+"""
+batch_runner.py
+Batch report generation: one AgentWorkflow per ticker, scheduled from a work queue onto a bounded pool of workers.
+
+- Sources: a list of tickers and / or a universe file (one ticker per line, or a CSV with a `ticker` column)
+- All runs share the process-wide rate limiters: OpenAI (LLM_RATE_LIMIT), Yahoo, FMP and SEC
+- Every finished report is written to the output directory and recorded in a checkpoint file,
+  so a crashed or interrupted batch resumes with the reports still missing
+- Throughput is reported in reports per hour
+- With --prefetch, the data of every pending report is fetched up front (src.report.agent.prefetch),
+  so the report runs only read local caches
+
+Usage:
+    python -m src.report.agent.batch_runner --tickers NVDA AMD INTC --year 2025 --quarter 1
+    python -m src.report.agent.batch_runner --universe universe.csv --year 2025 --quarter 1 --workers 8 --llm-rate 5 --prefetch
+"""
+from src.config.config import (
+    REPORT_OUTPUT_DIR,
+    LLM_RATE_LIMIT,
+    SEC_RATE_LIMIT,
+    FMP_RATE_LIMIT,
+    YAHOO_RATE_LIMIT
+)
+from src.fdata_extractors.rate_limiter import get_rate_limiter
+from src.report.agent.workflow import AgentWorkflow
+from src.report.agent.prefetch import ReportPrefetcher, print_report as print_prefetch_report
+from src.report.llm import LLMClientRegistry
+
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Dict, List, Optional
+import argparse
+import asyncio
+import csv
+import json
+import os
+import time
+
+REPORT_TIMEOUT = 1800 ## Seconds allowed for one report
+TEAM_CONCURRENCY = 5 ## Teams running at once inside one report
+
+
+@dataclass
+class ReportJob:
+    ticker: str
+    year: int
+    quarter: int
+
+    @property
+    def key(self) -> str:
+        return f"{self.ticker}_{self.year}_Q{self.quarter}"
+
+
+@dataclass
+class ReportResult:
+    key: str
+    seconds: float
+    output_path: Optional[str] = None
+    error: Optional[str] = None
+    finished_at: Optional[float] = None
+
+
+def read_universe(path: Path) -> List[str]:
+    """Tickers of a universe file: a CSV with a `ticker` column, or one ticker per line (blank lines and # comments skipped)."""
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        lines = [line.strip() for line in f if line.strip() and not line.lstrip().startswith('#')]
+    if lines and ',' in lines[0]:
+        rows = list(csv.DictReader(lines))
+        column = next((c for c in rows[0] if c.strip().lower() == 'ticker'), None) if rows else None
+        if column is None:
+            raise ValueError(f"[read_universe] No `ticker` column in {path}")
+        return [row[column].strip().upper() for row in rows if row[column].strip()]
+    return [line.upper() for line in lines]
+
+
+def _write_json_atomic(data, path: Path):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, default=str)
+        os.replace(tmp_path, path)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+
+
+class Checkpoint:
+    """Result of every finished report, keyed on ReportJob.key and rewritten atomically after each report."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.results: Dict[str, dict] = {}
+        if self.path.exists():
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self.results = json.load(f)
+
+    def is_done(self, job: ReportJob) -> bool:
+        result = self.results.get(job.key)
+        return (result is not None
+                and result.get('error') is None
+                and result.get('output_path') is not None
+                and Path(result['output_path']).exists())
+
+    def record(self, result: ReportResult):
+        self.results[result.key] = asdict(result)
+        _write_json_atomic(self.results, self.path)
+
+
+def set_rate_limits(llm_rate: float = LLM_RATE_LIMIT,
+                    yahoo_rate: float = YAHOO_RATE_LIMIT,
+                    fmp_rate: float = FMP_RATE_LIMIT,
+                    sec_rate: float = SEC_RATE_LIMIT):
+    """Define the process-wide limiters shared by every run. Must be called before the first workflow is built."""
+    LLMClientRegistry.set_rate_limit(llm_rate)
+    get_rate_limiter('yahoo', rate=yahoo_rate)
+    get_rate_limiter('fmp', rate=fmp_rate)
+    get_rate_limiter('sec', rate=sec_rate)
+
+
+async def run_report(job: ReportJob, output_dir: Path, timeout: int) -> ReportResult:
+    """Build and run one report. Errors are reported in the result, never raised."""
+    start = time.perf_counter()
+    try:
+        workflow = await asyncio.to_thread(AgentWorkflow, job.ticker, job.year, job.quarter)
+        output = await asyncio.wait_for(workflow.arun(max_concurrency=TEAM_CONCURRENCY), timeout=timeout or None)
+        output_path = Path(output_dir) / f"{job.key}.json"
+        _write_json_atomic(output, output_path)
+        return ReportResult(job.key, time.perf_counter() - start, output_path=str(output_path), finished_at=time.time())
+    except asyncio.TimeoutError:
+        return ReportResult(job.key, time.perf_counter() - start, error=f'Timed out after {timeout} s', finished_at=time.time())
+    except Exception as e:
+        return ReportResult(job.key, time.perf_counter() - start, error=f'{type(e).__name__}: {e}', finished_at=time.time())
+
+
+async def run_batch(jobs: List[ReportJob],
+                    output_dir: Path = REPORT_OUTPUT_DIR,
+                    max_workers: int = 4,
+                    timeout: int = REPORT_TIMEOUT) -> List[ReportResult]:
+    """Run every job not already done according to the checkpoint in `output_dir`, `max_workers` reports at a time."""
+    output_dir = Path(output_dir)
+    checkpoint = Checkpoint(output_dir / 'checkpoint.json')
+    pending = [job for job in jobs if not checkpoint.is_done(job)]
+    print(f"{len(jobs) - len(pending)}/{len(jobs)} reports already done, {len(pending)} to run")
+
+    queue: asyncio.Queue = asyncio.Queue()
+    for job in pending:
+        queue.put_nowait(job)
+    results = []
+    start = time.perf_counter()
+
+    async def worker():
+        while True:
+            try:
+                job = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            result = await run_report(job, output_dir, timeout)
+            checkpoint.record(result)
+            results.append(result)
+            n_done = sum(r.error is None for r in results)
+            rate = n_done / (time.perf_counter() - start) * 3600
+            status = 'ok' if result.error is None else f'FAILED ({result.error})'
+            print(f"[{len(results)}/{len(pending)}] {job.key} {result.seconds:.1f} s {status}, {rate:.1f} reports/hour")
+
+    await asyncio.gather(*[worker() for _ in range(min(max_workers, len(pending)))])
+    return results
+
+
+def print_report(results: List[ReportResult], elapsed: float):
+    failures = [r for r in results if r.error is not None]
+    n_done = len(results) - len(failures)
+    print("---")
+    print(f"{n_done}/{len(results)} reports written in {elapsed:.1f} s"
+          + (f", {n_done / elapsed * 3600:.1f} reports/hour" if elapsed > 0 else ""))
+    if results:
+        slowest = sorted(results, key=lambda r: r.seconds, reverse=True)[:5]
+        print("Slowest: " + ", ".join(f"{r.key} {r.seconds:.1f} s" for r in slowest))
+    for r in failures:
+        print(f"Failed: {r.key}: {r.error}")
+
+
+if __name__ == '__main__':
+    arg_parser = argparse.ArgumentParser(description='Generate reports for many tickers, resuming from the checkpoint in the output directory.')
+    arg_parser.add_argument('--tickers', nargs='*', default=[])
+    arg_parser.add_argument('--universe', type=Path, default=None, help='Ticker list: one per line, or a CSV with a ticker column')
+    arg_parser.add_argument('--year', type=int, required=True)
+    arg_parser.add_argument('--quarter', type=int, required=True)
+    arg_parser.add_argument('--output-dir', type=Path, default=REPORT_OUTPUT_DIR)
+    arg_parser.add_argument('--workers', type=int, default=4, help='Reports running at once')
+    arg_parser.add_argument('--timeout', type=int, default=REPORT_TIMEOUT, help='Seconds per report, 0 for no limit')
+    arg_parser.add_argument('--llm-rate', type=float, default=LLM_RATE_LIMIT, help='OpenAI requests / second, 0 for no limit')
+    arg_parser.add_argument('--yahoo-rate', type=float, default=YAHOO_RATE_LIMIT, help='Yahoo requests / second')
+    arg_parser.add_argument('--fmp-rate', type=float, default=FMP_RATE_LIMIT, help='FMP requests / second')
+    arg_parser.add_argument('--sec-rate', type=float, default=SEC_RATE_LIMIT, help='SEC requests / second')
+    arg_parser.add_argument('--prefetch', action='store_true', help='Fetch the data of every pending report before the LLM runs')
+    args = arg_parser.parse_args()
+
+    tickers = [t.upper() for t in args.tickers] + (read_universe(args.universe) if args.universe else [])
+    if not tickers:
+        arg_parser.error('Nothing to run: pass --tickers and / or --universe')
+    jobs = [ReportJob(ticker=t, year=args.year, quarter=args.quarter) for t in dict.fromkeys(tickers)]
+
+    set_rate_limits(llm_rate=args.llm_rate, yahoo_rate=args.yahoo_rate, fmp_rate=args.fmp_rate, sec_rate=args.sec_rate)
+    start = time.perf_counter()
+    if args.prefetch:
+        checkpoint = Checkpoint(args.output_dir / 'checkpoint.json')
+        pending = [job.ticker for job in jobs if not checkpoint.is_done(job)]
+        if pending:
+            prefetcher = ReportPrefetcher(pending, args.year, args.quarter, sec_rate=args.sec_rate)
+            print_prefetch_report(prefetcher.run(), time.perf_counter() - start)
+    results = asyncio.run(run_batch(jobs, output_dir=args.output_dir, max_workers=args.workers, timeout=args.timeout))
+    print_report(results, time.perf_counter() - start)
+    raise SystemExit(1 if any(r.error for r in results) else 0)
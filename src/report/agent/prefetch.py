@@ -0,0 +1,172 @@
+"""
+prefetch.py
+Warm every local data cache for a batch of reports before any LLM work starts.
+
+The upstream sources run concurrently with each other, using their bulk endpoints where they exist:
+- Mongo transcripts: one `$in` query for the batch       -> FDATA_DIR/ECC_{ticker}_{year}_Q{quarter}.json
+- MySQL competitors: one `IN` query for the batch        -> FDATA_DIR/Competitors_{ticker}.json
+- FMP product segments: concurrent requests, one per ticker, through the shared FMP client -> FMP response cache
+- SEC 10-K items: the batch extractor's process pool, for tickers without items yet -> FDATA_DIR/10K_Items_{ticker}.json
+- yfinance info, prices and statements: per ticker on a thread pool -> yfinance cache
+
+ReportDataContext reads these caches first (the transcript and competitors files for PREFETCH_MAX_AGE),
+so the AgentWorkflow runs that follow only read local data.
+
+Usage:
+    python -m src.report.agent.prefetch --tickers NVDA AMD INTC --year 2025 --quarter 1
+"""
+from src.fdata_extractors import FMPTranscriptFetcher, MySQLExtractor, get_fmp_client
+from src.fdata_extractors.batch_extractor import ExtractionJob, run_batch, write_items_atomic, output_path_for
+from src.config.config import SEC_RATE_LIMIT
+from src.fdata_extractors.utils import MAX_WORKERS
+from src.report.agent.tool import ReportDataContext
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, List
+import argparse
+import asyncio
+import time
+
+
+@dataclass
+class PrefetchResult:
+    source: str
+    seconds: float = 0.0
+    n_fetched: int = 0
+    errors: List[str] = field(default_factory=list)
+
+
+class ReportPrefetcher:
+
+    ## Context datasets read from yfinance (through its on-disk cache)
+    YFINANCE_DATASETS = [
+        'yfinance_stock_price',
+        'yfinance_info',
+        'yfinance_past_q_bs',
+        'yfinance_past_q_is',
+        'yfinance_past_q_cf',
+    ]
+
+    def __init__(self,
+                 tickers: List[str],
+                 year: int,
+                 quarter: int,
+                 max_workers: int = MAX_WORKERS,
+                 sec_rate: float = SEC_RATE_LIMIT):
+        """
+        Parameters:
+        tickers (list[str]): Tickers of the batch. Duplicates are dropped.
+        year (int), quarter (int): Report period.
+        max_workers (int): Threads fetching yfinance data, processes splitting 10-K filings.
+        sec_rate (float): SEC requests / second, shared by the filing processes.
+        """
+        self.tickers = list(dict.fromkeys(t.upper() for t in tickers))
+        self.year = year
+        self.quarter = quarter
+        self.max_workers = max_workers
+        self.sec_rate = sec_rate
+
+    ## ---------------------------------------------------- Sources ---------------------------------------------------- ##
+    def prefetch_transcripts(self, result: PrefetchResult):
+        keys = [(ticker, self.year, self.quarter) for ticker in self.tickers]
+        transcripts = FMPTranscriptFetcher().fetch_many(keys)
+        for key in keys:
+            if key in transcripts:
+                write_items_atomic(transcripts[key], ReportDataContext.ecc_path(*key))
+                result.n_fetched += 1
+            else:
+                result.errors.append(f"{key[0]}: no transcript for {key[1]} Q{key[2]}")
+
+    def prefetch_competitors(self, result: PrefetchResult):
+        competitors = MySQLExtractor.get_competitors_bulk(self.tickers, competitors_limit=ReportDataContext.N_COMPETITORS)
+        for ticker, df in competitors.items():
+            if df.empty:
+                result.errors.append(f"{ticker}: no competitor")
+                continue
+            write_items_atomic(ReportDataContext.competitors_to_json(df), ReportDataContext.competitors_path(ticker))
+            result.n_fetched += 1
+
+    def prefetch_fmp(self, result: PrefetchResult):
+        segmentation = get_fmp_client().get_product_segmentation_many(self.tickers, period='annual')
+        result.n_fetched = len(segmentation)
+        result.errors.extend(f"{ticker}: request failed" for ticker in self.tickers if ticker not in segmentation)
+
+    def prefetch_filings(self, result: PrefetchResult):
+        jobs = [ExtractionJob(ticker=ticker) for ticker in self.tickers
+                if not output_path_for(ticker, ReportDataContext.FDATA_DIR).exists()]
+        result.n_fetched = len(self.tickers) - len(jobs)
+        if not jobs:
+            return
+        for r in run_batch(jobs,
+                           output_dir=ReportDataContext.FDATA_DIR,
+                           max_workers=min(self.max_workers, len(jobs)),
+                           sec_rate=self.sec_rate):
+            if r.error is None:
+                result.n_fetched += 1
+            else:
+                result.errors.append(f"{r.ticker}: {r.error}")
+
+    def _prefetch_yfinance_ticker(self, ticker: str) -> List[str]:
+        context = ReportDataContext.load(ticker=ticker, year=self.year, quarter=self.quarter)
+        errors = []
+        for dataset in self.YFINANCE_DATASETS:
+            try:
+                getattr(context, dataset)
+            except Exception as e:
+                errors.append(f"{ticker} {dataset}: {type(e).__name__}: {e}")
+        return errors
+
+    def prefetch_yfinance(self, result: PrefetchResult):
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for errors in executor.map(self._prefetch_yfinance_ticker, self.tickers):
+                result.errors.extend(errors)
+                if not errors:
+                    result.n_fetched += 1
+
+    ## ---------------------------------------------------- Pipeline ---------------------------------------------------- ##
+    async def _run_source(self, source: str, prefetch: Callable[[PrefetchResult], None]) -> PrefetchResult:
+        """Run one source in its own thread. A failing source is reported in its result and never stops the others."""
+        result = PrefetchResult(source)
+        start = time.perf_counter()
+        try:
+            await asyncio.to_thread(prefetch, result)
+        except Exception as e:
+            result.errors.append(f"{type(e).__name__}: {e}")
+        result.seconds = time.perf_counter() - start
+        print(f"[{source}] {result.n_fetched}/{len(self.tickers)} tickers in {result.seconds:.1f} s")
+        return result
+
+    async def arun(self) -> List[PrefetchResult]:
+        return await asyncio.gather(
+            self._run_source('transcripts', self.prefetch_transcripts),
+            self._run_source('competitors', self.prefetch_competitors),
+            self._run_source('fmp', self.prefetch_fmp),
+            self._run_source('sec', self.prefetch_filings),
+            self._run_source('yfinance', self.prefetch_yfinance),
+        )
+
+    def run(self) -> List[PrefetchResult]:
+        return asyncio.run(self.arun())
+
+
+def print_report(results: List[PrefetchResult], elapsed: float):
+    print("---")
+    print(f"Prefetch done in {elapsed:.1f} s (sum over sources: {sum(r.seconds for r in results):.1f} s)")
+    for r in results:
+        for error in r.errors:
+            print(f"[{r.source}] {error}")
+
+
+if __name__ == '__main__':
+    arg_parser = argparse.ArgumentParser(description='Warm the local data caches for a batch of reports.')
+    arg_parser.add_argument('--tickers', nargs='+', required=True)
+    arg_parser.add_argument('--year', type=int, required=True)
+    arg_parser.add_argument('--quarter', type=int, required=True)
+    arg_parser.add_argument('--workers', type=int, default=MAX_WORKERS)
+    arg_parser.add_argument('--sec-rate', type=float, default=SEC_RATE_LIMIT, help='SEC requests / second')
+    args = arg_parser.parse_args()
+
+    start = time.perf_counter()
+    results = ReportPrefetcher(args.tickers, args.year, args.quarter, max_workers=args.workers, sec_rate=args.sec_rate).run()
+    print_report(results, time.perf_counter() - start)
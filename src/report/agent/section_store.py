@@ -0,0 +1,67 @@
+from src.config.config import REPORT_SECTION_CACHE_DIR
+
+from pathlib import Path
+from typing import Dict, Optional, Union
+import json
+import os
+import time
+
+
+class SectionStore:
+    """
+    Last written section of each team, stored on disk per (ticker, year, quarter, team)
+    with the fingerprint of the inputs it was written from.
+    A section is only served back while that fingerprint is unchanged.
+    """
+
+    def __init__(self, cache_dir: Union[str, Path] = REPORT_SECTION_CACHE_DIR):
+        """
+        Parameters:
+        cache_dir (str | Path): Directory holding the stored sections.
+        """
+        self.cache_dir = Path(cache_dir)
+
+    def _path(self, ticker: str, year: int, quarter: int, team_name: str) -> Path:
+        return self.cache_dir / f"{ticker.upper()}_{year}_Q{quarter}" / f"{team_name}.json"
+
+    def get(self, ticker: str, year: int, quarter: int, team_name: str, fingerprint: Optional[str]) -> Optional[str]:
+        """The stored section if it was written from inputs with this fingerprint, else None."""
+        if fingerprint is None:
+            return None
+        try:
+            with open(self._path(ticker, year, quarter, team_name), 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if entry.get('fingerprint') != fingerprint:
+            return None
+        return entry['section']
+
+    def put(self,
+            ticker: str,
+            year: int,
+            quarter: int,
+            team_name: str,
+            fingerprint: str,
+            section: str,
+            inputs: Optional[Dict[str, str]] = None):
+        """
+        Store a team's written section.
+
+        inputs: fingerprint of each dataset the team read, kept to see which input changed between two runs.
+        """
+        path = self._path(ticker, year, quarter, team_name)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({
+                    'fingerprint': fingerprint,
+                    'inputs': inputs or {},
+                    'written_at': time.time(),
+                    'section': section,
+                }, f)
+            os.replace(tmp_path, path)
+        finally:
+            if tmp_path.exists():
+                tmp_path.unlink()
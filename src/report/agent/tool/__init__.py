@@ -1,8 +1,13 @@
+from .retrieval import BM25ChunkIndex, get_token_counter
+from .data_context import ReportDataContext
 from .tool_utils import ToolsHelper
 from .agent_tools import AgentTools
 from .human_tools import HumanTools
 
 __all__ = [
+    'BM25ChunkIndex',
+    'get_token_counter',
+    'ReportDataContext',
     'ToolsHelper',
     'AgentTools',
     'HumanTools'
@@ -8,9 +8,9 @@ agent_tools.py
     - Here is you can register your tool as Langchain BaseTool.
 - step 3: use your tools @ src.report.agent.hub.agent_hub_config.py
 """
-from src.report.agent.tool import ToolsHelper
+from src.report.agent.tool import ToolsHelper, ReportDataContext
 
-from typing import Dict, List, Tuple, Literal, Union, Callable
+from typing import Dict, List, Tuple, Literal, Union, Callable, Optional
 import pandas as pd
 from langchain_core.tools import tool
 from langchain_core.runnables import Runnable
@@ -18,12 +18,34 @@ from langchain_core.tools.base import ArgsSchema, BaseTool
 
 class AgentTools(ToolsHelper):
 
+    ## ReportDataContext datasets each tool reads, used to fingerprint a team's inputs
+    TOOL_DATASETS: Dict[str, List[str]] = {
+        'Estimate_Price': ['yfinance_stock_price'],
+        'Estimate_PE': ['yfinance_stock_price', 'yfinance_info'],
+        'Latest_Earning_Transcripts': ['ecc_content'],
+        'Main_Products': ['fmp_past_y_product_segment_rev'],
+        'Yearly_Product_Revenue_Growth': ['fmp_past_y_product_segment_rev_growth'],
+        'Latest_SEC_Filing_10K_item1': ['latest_filing_item1'],
+        'Latest_SEC_Filing_10K_item1a': ['latest_filing_item1a'],
+        'Latest_SEC_Filing_10K_item7': ['latest_filing_item7'],
+        'Stock_Price_Movement': ['yfinance_stock_price'],
+        'Quarterly_Current_Ratio': ['yfinance_past_q_bs'],
+        'Quarterly_Cash_Ratio': ['yfinance_past_q_bs'],
+        'Quarterly_Quick_ratio': ['yfinance_past_q_bs'],
+        'Quarterly_Total_revenue': ['yfinance_past_q_is'],
+        'Quarterly_Total_Revenue_Growth': ['yfinance_past_q_is_growth'],
+        'Quarterly_Ebitda': ['yfinance_past_q_is'],
+        'Quarterly_Ebitda_Growth': ['yfinance_past_q_is_growth'],
+        'Competitors_Info': ['competitors'],
+    }
+
     def __init__(self,
                  ticker: str,
                  year: int,
-                 quarter: int):
+                 quarter: int,
+                 data_context: Optional[ReportDataContext] = None):
 
-        super().__init__(ticker=ticker, year=year, quarter=quarter)
+        super().__init__(ticker=ticker, year=year, quarter=quarter, data_context=data_context)
         ## Wrapping Tools
         ## ---------------------------------------------------- EST. DATA ------------------------------------------------- ##
         self.get_estimate_price = tool(
@@ -39,7 +61,7 @@ class AgentTools(ToolsHelper):
         ## ECC
         self.get_latest_ecc_tool = tool(
             name_or_callable='Latest_Earning_Transcripts',
-            description='Get latest earning conference call transcripts for the ticker.'
+            description='Get latest earning conference call transcripts for the ticker. Pass a search query (keywords of what you are looking for); returns the most relevant passages.'
         )(self._get_latest_ecc)
 
         ## Main Product
@@ -57,17 +79,17 @@ class AgentTools(ToolsHelper):
         ## ---------------------------------------------------- SEC Filing Tools ---------------------------------------------------- ##
         self.get_latest_filing_item1_tool = tool(
             name_or_callable='Latest_SEC_Filing_10K_item1',
-            description='Get Latest SEC Filing 10K item1 for the ticker. item1 is about Business Description'
+            description='Get Latest SEC Filing 10K item1 for the ticker. item1 is about Business Description. Pass a search query (keywords of what you are looking for); returns the most relevant passages.'
         )(self._get_latest_filing_item1)
 
         self.get_latest_filing_item1a_tool = tool(
             name_or_callable='Latest_SEC_Filing_10K_item1a',
-            description='Get Latest SEC Filing 10K item1a for the ticker. item1a is about Risk Factors'
+            description='Get Latest SEC Filing 10K item1a for the ticker. item1a is about Risk Factors. Pass a search query (keywords of what you are looking for); returns the most relevant passages.'
         )(self._get_latest_filing_item1a)
 
         self.get_latest_filing_item7_tool = tool(
             name_or_callable='Latest_SEC_Filing_10K_item7',
-            description='Get Latest SEC Filing 10K item7 for the ticker. item7 is about Management’s Discussion and Analysis (MD&A)'
+            description='Get Latest SEC Filing 10K item7 for the ticker. item7 is about Management’s Discussion and Analysis (MD&A). Pass a search query (keywords of what you are looking for); returns the most relevant passages.'
         )(self._get_latest_filing_item7)
         ## ---------------------------------------------------- Yfinance Tools ---------------------------------------------------- ##
         ## Stock Price
@@ -0,0 +1,270 @@
+from src.report.agent.tool.retrieval import BM25ChunkIndex
+from src.config.config import FDATA_DIR, PREFETCH_MAX_AGE
+from src.fdata_extractors import (
+    FMPTranscriptFetcher,
+    FMPAnalyzer,
+    SecFilingExtractor,
+    YFinanceAnalyzer,
+    MySQLExtractor
+)
+
+from dataclasses import dataclass
+from functools import cached_property
+from typing import ClassVar, Dict, List, Optional
+import pandas as pd
+from pathlib import Path
+import hashlib
+import json
+import time
+
+
+@dataclass(frozen=True)
+class ReportDataContext:
+    """
+    Immutable, lazily loaded view of every dataset the report tools read for one (ticker, year, quarter).
+    Each dataset is fetched on first access and memoized, so a team only pays for the data its tools touch.
+    Create it once per report with `ReportDataContext.load` and inject it into all agent teams and HumanTools.
+    """
+
+    P: ClassVar[Path] = Path(__file__).resolve()
+    PROJECT_DIR: ClassVar[Path] = P.parents[3]
+    FDATA_DIR: ClassVar[Path] = FDATA_DIR
+    PREFETCH_MAX_AGE: ClassVar[float] = PREFETCH_MAX_AGE ## Seconds a prefetched file is served before going back upstream
+
+    BS_VARIABLES: ClassVar[List[str]] = ['current_liabilities', 'current_assets', 'cash_and_cash_equivalents', 'accounts_receivable'] # balance sheet
+    CF_VARIABLES: ClassVar[List[str]] = ['free_cash_flow'] # cash flow
+    IS_VARIABLES: ClassVar[Optional[List[str]]] = None # income statement, None means all the variables
+
+    N_QUARTERS: ClassVar[int] = 4 ## How many past quarter data to extract?
+    N_YEARS: ClassVar[int] = 3 ## How many past year data to extract?
+    CHUNK_TOKENS: ClassVar[int] = 300 ## Chunk size of the retrieval indexes over long texts
+    N_COMPETITORS: ClassVar[int] = 3 ## How many competitors to compare with?
+
+    DATASETS: ClassVar[List[str]] = [
+        'ecc_content',
+        'fmp_past_y_product_segment_rev',
+        'fmp_past_y_product_segment_rev_growth',
+        'latest_filing_item1',
+        'latest_filing_item1a',
+        'latest_filing_item7',
+        'yfinance_stock_price',
+        'yfinance_info',
+        'yfinance_past_q_bs',
+        'yfinance_past_q_is',
+        'yfinance_past_q_cf',
+        'yfinance_past_q_bs_growth',
+        'yfinance_past_q_is_growth',
+        'yfinance_past_q_cf_growth',
+        'competitors',
+    ]
+
+    ticker: str
+    year: int
+    quarter: int
+
+    @classmethod
+    def load(cls, ticker: str, year: int, quarter: int) -> "ReportDataContext":
+        """Create the context for one report. Nothing is fetched until a dataset is first accessed."""
+        return cls(ticker=ticker, year=year, quarter=quarter)
+
+    ## ---------------------------------------------------- Local data cache ---------------------------------------------------- ##
+    ## Files written by the batch prefetch (src.report.agent.prefetch), read before the upstream source while fresh
+    @classmethod
+    def ecc_path(cls, ticker: str, year: int, quarter: int) -> Path:
+        return cls.FDATA_DIR / f'ECC_{ticker}_{year}_Q{quarter}.json'
+
+    @classmethod
+    def competitors_path(cls, ticker: str) -> Path:
+        return cls.FDATA_DIR / f'Competitors_{ticker}.json'
+
+    @classmethod
+    def _read_prefetched(cls, path: Path) -> Optional[dict]:
+        """Content of a prefetched file, None if it is missing or older than PREFETCH_MAX_AGE."""
+        try:
+            if time.time() - path.stat().st_mtime > cls.PREFETCH_MAX_AGE:
+                return None
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def competitors_to_json(df: pd.DataFrame) -> dict:
+        """JSON-safe form of a competitors frame, keeping its dtypes so the frame (and its fingerprint) reads back unchanged."""
+        return {
+            'dtypes': df.dtypes.astype(str).to_dict(),
+            'records': json.loads(df.to_json(orient='records', date_format='iso', date_unit='us', default_handler=str)),
+        }
+
+    @staticmethod
+    def competitors_from_json(data: dict) -> pd.DataFrame:
+        return pd.DataFrame(data['records'], columns=list(data['dtypes'])).astype(data['dtypes'])
+
+    ## ---------------------------------------------------- Extractors ---------------------------------------------------- ##
+    @cached_property
+    def _yfinance(self) -> YFinanceAnalyzer:
+        return YFinanceAnalyzer(self.ticker)
+
+    @cached_property
+    def _fmp_findata(self) -> FMPAnalyzer:
+        return FMPAnalyzer(self.ticker)
+
+    ## ---------------------------------------------------- FMP / DB - ECC Data ---------------------------------------------------- ##
+    @cached_property
+    def ecc_content(self) -> str:
+        # return FMPTranscriptFetcher().fetch(ticker=self.ticker, year=self.year, quarter=self.quarter)['content']
+        prefetched = self._read_prefetched(self.ecc_path(self.ticker, self.year, self.quarter))
+        if prefetched is not None:
+            return prefetched['content']
+        return FMPTranscriptFetcher().fetch_from_db(ticker=self.ticker, year=self.year, quarter=self.quarter)['content']
+
+    @cached_property
+    def ecc_index(self) -> BM25ChunkIndex:
+        return BM25ChunkIndex(self.ecc_content, chunk_tokens=self.CHUNK_TOKENS)
+
+    ## ---------------------------------------------------- FMP - Financial Data ---------------------------------------------------- ##
+    @cached_property
+    def fmp_past_y_product_segment_rev(self) -> pd.DataFrame:
+        try:
+            return self._fmp_findata.get_product_segment_revenue(n_years=self.N_YEARS)
+        except:
+            return pd.DataFrame()
+
+    @cached_property
+    def fmp_past_y_product_segment_rev_growth(self) -> pd.DataFrame:
+        try:
+            return self._fmp_findata.get_product_segment_revenue_growth(n_years=self.N_YEARS)
+        except:
+            return pd.DataFrame()
+
+    ## ---------------------------------------------------- SEC FILING - Items ---------------------------------------------------- ##
+    @cached_property
+    def _latest_filing(self) -> Dict[str, str]:
+        try:
+            file_path = self.FDATA_DIR / f'10K_Items_{self.ticker}.json'
+            with open(file_path, 'r', encoding='cp1252') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return SecFilingExtractor().fetch(ticker=self.ticker)
+
+    @cached_property
+    def latest_filing_item1(self) -> str:
+        return self._latest_filing['item1']
+
+    @cached_property
+    def latest_filing_item1a(self) -> str:
+        return self._latest_filing['item1a']
+
+    @cached_property
+    def latest_filing_item7(self) -> str:
+        return self._latest_filing['item7']
+
+    @cached_property
+    def latest_filing_item1_index(self) -> BM25ChunkIndex:
+        return BM25ChunkIndex(self.latest_filing_item1, chunk_tokens=self.CHUNK_TOKENS)
+
+    @cached_property
+    def latest_filing_item1a_index(self) -> BM25ChunkIndex:
+        return BM25ChunkIndex(self.latest_filing_item1a, chunk_tokens=self.CHUNK_TOKENS)
+
+    @cached_property
+    def latest_filing_item7_index(self) -> BM25ChunkIndex:
+        return BM25ChunkIndex(self.latest_filing_item7, chunk_tokens=self.CHUNK_TOKENS)
+
+    ## ---------------------------------------------------- Yfinance - Financial Data ---------------------------------------------------- ##
+    @cached_property
+    def yfinance_stock_price(self) -> pd.Series:
+        return self._yfinance.get_price(period='1y')
+
+    @cached_property
+    def yfinance_info(self) -> dict:
+        return self._yfinance.info
+
+    @cached_property
+    def yfinance_past_q_bs(self) -> pd.DataFrame:
+        return self._yfinance.get_past_balance_sheet(n_quarters=self.N_QUARTERS, selected_columns=self.BS_VARIABLES)
+
+    @cached_property
+    def yfinance_past_q_is(self) -> pd.DataFrame:
+        return self._yfinance.get_past_income_statement(n_quarters=self.N_QUARTERS, selected_columns=self.IS_VARIABLES)
+
+    @cached_property
+    def yfinance_past_q_cf(self) -> pd.DataFrame:
+        return self._yfinance.get_past_cash_flow(n_quarters=self.N_QUARTERS, selected_columns=self.CF_VARIABLES)
+
+    @cached_property
+    def yfinance_past_q_bs_growth(self) -> pd.DataFrame:
+        return self._yfinance.get_past_balance_sheet_growth(n_quarters=self.N_QUARTERS, selected_columns=self.BS_VARIABLES)
+
+    @cached_property
+    def yfinance_past_q_is_growth(self) -> pd.DataFrame:
+        return self._yfinance.get_past_income_statement_growth(n_quarters=self.N_QUARTERS, selected_columns=self.IS_VARIABLES)
+
+    @cached_property
+    def yfinance_past_q_cf_growth(self) -> pd.DataFrame:
+        return self._yfinance.get_past_cash_flow_growth(n_quarters=self.N_QUARTERS, selected_columns=self.CF_VARIABLES)
+
+    ## ---------------------------------------------------- Local SQL - Competitor data ---------------------------------------------------- ##
+    @cached_property
+    def competitors(self) -> pd.DataFrame:
+        prefetched = self._read_prefetched(self.competitors_path(self.ticker))
+        if prefetched is not None:
+            return self.competitors_from_json(prefetched)
+        return MySQLExtractor(self.ticker)._get_competitors(competitors_limit=self.N_COMPETITORS)
+
+    ## ---------------------------------------------------- Fingerprints ---------------------------------------------------- ##
+    def fingerprint(self, dataset: str) -> str:
+        """Content hash of one dataset, stable across runs and processes."""
+        data = getattr(self, dataset)
+        h = hashlib.sha256(type(data).__name__.encode())
+        if isinstance(data, (pd.DataFrame, pd.Series)):
+            h.update(pd.util.hash_pandas_object(data, index=True).values.tobytes())
+            if isinstance(data, pd.DataFrame):
+                h.update(json.dumps([str(col) for col in data.columns]).encode())
+        elif isinstance(data, str):
+            h.update(data.encode('utf-8'))
+        else:
+            h.update(json.dumps(data, sort_keys=True, default=str).encode())
+        return h.hexdigest()
+
+    def check_key(self, ticker: str, year: int, quarter: int):
+        """Make sure an injected context belongs to the report being built."""
+        if (self.ticker, self.year, self.quarter) != (ticker, year, quarter):
+            raise ValueError(
+                f"[{self.__class__.__name__}.check_key] Context was loaded for "
+                f"({self.ticker}, {self.year}, {self.quarter}), got ({ticker}, {year}, {quarter})."
+            )
+
+
+if __name__ == '__main__':
+    ## Benchmark: one context per team + HumanTools (previous behaviour) vs. one shared context per report,
+    ## every consumer touching the full dataset catalog
+    import time
+    from collections import Counter
+
+    calls = Counter()
+
+    def _count(cls, name):
+        orig = getattr(cls, name)
+
+        def wrapper(*args, **kwargs):
+            calls[f"{cls.__name__}.{name}"] += 1
+            return orig(*args, **kwargs)
+        setattr(cls, name, wrapper)
+
+    _count(YFinanceAnalyzer, '__init__')
+    _count(FMPAnalyzer, 'get_product_data')
+    _count(FMPTranscriptFetcher, 'fetch_from_db')
+    _count(MySQLExtractor, '_get_competitors')
+    _count(SecFilingExtractor, 'fetch')
+
+    n_consumers = 6 ## BSO, FVPD, RU, BD, CA teams + HumanTools
+    for label, n_loads in [('per-team', n_consumers), ('shared', 1)]:
+        calls.clear()
+        start = time.perf_counter()
+        contexts = [ReportDataContext.load('NVDA', 2025, 1) for _ in range(n_loads)]
+        for i in range(n_consumers):
+            for name in ReportDataContext.DATASETS:
+                getattr(contexts[i % n_loads], name)
+        end = time.perf_counter()
+        print(f"[{label}] Elapsed: {end - start:.6f} s, upstream calls: {sum(calls.values())} {dict(calls)}")
@@ -1,8 +1,9 @@
-from src.report.agent.tool import ToolsHelper
+from src.report.agent.tool import ToolsHelper, ReportDataContext
 from src.fdata_extractors import (
-    YFinanceAnalyzer
+    YFinanceAnalyzer,
+    YFinanceBatchAnalyzer
 )
-from typing import Dict, List, Tuple, Literal, Union, Callable
+from typing import Dict, List, Tuple, Literal, Union, Callable, Optional
 import random
 import asyncio
 
@@ -11,14 +12,17 @@ class HumanTools(ToolsHelper):
     def __init__(self,
                  ticker: str,
                  year: int,
-                 quarter: int):
+                 quarter: int,
+                 data_context: Optional[ReportDataContext] = None):
 
-        super().__init__(ticker=ticker, year=year, quarter=quarter)
+        super().__init__(ticker=ticker, year=year, quarter=quarter, data_context=data_context)
 
     ## Local MySQL
     async def _get_competitors_info(self):
         """Get competitors info for the ticker."""
-        output = self._create_dict(self.competitors[['competitor_name', 'competitor_ticker', 'competed_product']],
+        # the competitor table is loaded lazily: keep the blocking query off the event loop
+        competitors = await asyncio.to_thread(lambda: self.data_context.competitors)
+        output = self._create_dict(competitors[['competitor_name', 'competitor_ticker', 'competed_product']],
                                    'competitors_info',
                                    orient='records')
         return output
@@ -29,23 +33,38 @@ class HumanTools(ToolsHelper):
         """
         # run the blocking analytics in a thread
         if ticker != self.ticker:
-            yfinance = await asyncio.to_thread(YFinanceAnalyzer, ticker)
+            # the analyzer is lazy: only `info` and the 1y price history are fetched
+            yfinance = YFinanceAnalyzer(ticker)
             yfinance_c_info = await asyncio.to_thread(lambda: yfinance.info)
-            yfinance_stock = await asyncio.to_thread(lambda: yfinance.ticker.history(period='1y').Close)
+            yfinance_stock = await asyncio.to_thread(yfinance.get_price, period='1y')
         else:
-            yfinance_c_info = self.yfinance_info
-            yfinance_stock = self.yfinance_stock_price
+            yfinance_c_info = self.data_context.yfinance_info
+            yfinance_stock = self.data_context.yfinance_stock_price
 
-        pe = self._apply_round(yfinance_c_info.get('trailingPE', None))
-        current_price = self._apply_round(yfinance_c_info.get('currentPrice', None))
+        return self._build_ticker_data(ticker, yfinance_c_info, yfinance_stock.min(), yfinance_stock.max())
+
+    async def _fetch_batch_data(self, tickers: List[str]) -> List[Dict]:
+        """
+        Helper to fetch data for all tickers with one bulk quote request and one bulk price download.
+        """
+        summary = await asyncio.to_thread(YFinanceBatchAnalyzer(tickers).get_summary_records, period='1y')
+        return [
+            self._build_ticker_data(t, summary[t], summary[t]['one_year_low'], summary[t]['one_year_high'])
+            for t in tickers
+        ]
+
+    def _build_ticker_data(self, ticker: str, info: Dict, one_year_low: float, one_year_high: float) -> Dict:
+        """Comparison row for one ticker from its Yahoo summary fields and 1y closing price range."""
+        pe = self._apply_round(info.get('trailingPE', None))
+        current_price = self._apply_round(info.get('currentPrice', None))
         est_price = self._apply_round(current_price * random.uniform(0.8, 1.5))
         price_to_est_price = self._apply_round(current_price / est_price)
-        price_to_book = self._apply_round(current_price / yfinance_c_info.get('bookValue', None))
-        dividends_yield = self._apply_round(yfinance_c_info.get('dividendYield', None))
-        mkt_cap = yfinance_c_info.get('marketCap', None)
+        price_to_book = self._apply_round(current_price / info.get('bookValue', None))
+        dividends_yield = self._apply_round(info.get('dividendYield', None))
+        mkt_cap = info.get('marketCap', None)
 
-        one_year_low = self._apply_round(yfinance_stock.min())
-        one_year_high = self._apply_round(yfinance_stock.max())
+        one_year_low = self._apply_round(one_year_low)
+        one_year_high = self._apply_round(one_year_high)
         one_year_price_range = f"{one_year_low}-{one_year_high}"
 
         return {
@@ -60,17 +79,23 @@ class HumanTools(ToolsHelper):
             'one_year_price_range': one_year_price_range
         }
 
-    async def _get_comp_and_competitors_data(self) -> Dict[str, Dict]:
-        """Get competitors data for the ticker, asynchronously."""
+    async def _get_comp_and_competitors_data(self, batched: bool = True) -> Dict[str, Dict]:
+        """Get competitors data for the ticker, asynchronously.
+
+        batched: fetch every ticker in one bulk round-trip (default) instead of info + history per ticker.
+        """
         competitors = await self._get_competitors_info()
         tickers = [self.ticker] + [
             info['competitor_ticker']
             for info in competitors['competitors_info']
         ]
 
-        # fire off all fetches in parallel
-        fetch_tasks = [self._fetch_ticker_data(t) for t in tickers]
-        results = await asyncio.gather(*fetch_tasks)
+        if batched:
+            results = await self._fetch_batch_data(tickers)
+        else:
+            # fire off all fetches in parallel
+            fetch_tasks = [self._fetch_ticker_data(t) for t in tickers]
+            results = await asyncio.gather(*fetch_tasks)
 
         # combine into dict by ticker
         combined_data = {r['ticker']: {k: v for k, v in r.items() if k != 'ticker'} for r in results}
@@ -82,5 +107,15 @@ class HumanTools(ToolsHelper):
 
 if __name__ == '__main__':
 
+    import time
+
     helper = HumanTools('NVDA', 2025, 1)
-    asyncio.run(helper.main())
\ No newline at end of file
+    asyncio.run(helper._get_competitors_info()) # warm the competitor table before timing
+
+    ## Benchmark: info + history per ticker (2 x N round-trips) vs. one bulk fetch for all tickers
+    for batched in [False, True]:
+        start = time.perf_counter()
+        comp_and_data = asyncio.run(helper._get_comp_and_competitors_data(batched=batched))
+        end = time.perf_counter()
+        print(f"[{'batched' if batched else 'per-ticker'}] Elapsed: {end - start:.6f} s")
+        print(comp_and_data)
\ No newline at end of file
@@ -0,0 +1,167 @@
+from collections import Counter
+from typing import Callable, List, Optional
+import math
+import re
+
+try:
+    import tiktoken
+except ImportError:  # optional: fall back to a characters / 4 estimate
+    tiktoken = None
+
+
+def get_token_counter(model: str = 'gpt-4o') -> Callable[[str], int]:
+    """Token counter for `model`: tiktoken when available, otherwise ~4 characters per token."""
+    if tiktoken is not None:
+        try:
+            encoding = tiktoken.encoding_for_model(model)
+            return lambda text: len(encoding.encode(text, disallowed_special=()))
+        except Exception:
+            pass
+    return lambda text: math.ceil(len(text) / 4)
+
+
+class BM25ChunkIndex:
+    """
+    Local BM25 index over a long document (a 10-K item, an earning call transcript ...).
+
+    The document is split on paragraphs and packed into chunks of about `chunk_tokens` tokens.
+    `search` returns the best-matching chunks for a query, within a token budget, so a tool call
+    pastes a few relevant passages into the prompt instead of the whole section.
+    """
+
+    K1 = 1.5
+    B = 0.75
+    TOKEN_PATTERN = re.compile(r"[a-z0-9]+(?:[.'][a-z0-9]+)*")
+    STOPWORDS = frozenset(
+        "a an and are as at be by for from has have in is it its of on or that the this to was were will with "
+        "we our us you your they their which what how".split()
+    )
+
+    def __init__(self,
+                 text: str,
+                 chunk_tokens: int = 300,
+                 count_tokens: Optional[Callable[[str], int]] = None):
+        """
+        Parameters:
+        text (str): Document to index.
+        chunk_tokens (int): Target chunk size in tokens.
+        count_tokens (callable): Token counter, defaults to `get_token_counter()`.
+        """
+        self.count_tokens = count_tokens or get_token_counter()
+        self.chunks = self._chunk(text or '', chunk_tokens)
+        self.chunk_n_tokens = [self.count_tokens(chunk) for chunk in self.chunks]
+
+        self._term_freqs = [Counter(self._tokenize(chunk)) for chunk in self.chunks]
+        self._doc_lens = [sum(tf.values()) for tf in self._term_freqs]
+        self._avg_doc_len = (sum(self._doc_lens) / len(self._doc_lens)) if self._doc_lens else 0.0
+        doc_freqs = Counter(term for tf in self._term_freqs for term in tf)
+        n_chunks = len(self.chunks)
+        self._idf = {term: math.log(1 + (n_chunks - df + 0.5) / (df + 0.5)) for term, df in doc_freqs.items()}
+
+    @classmethod
+    def _tokenize(cls, text: str) -> List[str]:
+        return [token for token in cls.TOKEN_PATTERN.findall(text.lower()) if token not in cls.STOPWORDS]
+
+    def _split_tokens(self, text: str, max_tokens: int) -> List[str]:
+        """Cut `text` into windows of at most `max_tokens` tokens, on whitespace where possible."""
+        n_tokens = self.count_tokens(text)
+        if n_tokens <= max_tokens:
+            return [text]
+        window_chars = max(1, len(text) * max_tokens // n_tokens)
+        windows = []
+        while text:
+            end = min(len(text), window_chars)
+            while end > 1 and self.count_tokens(text[:end]) > max_tokens:
+                end = end * 9 // 10
+            if end < len(text):
+                space = text.rfind(' ', 0, end + 1)
+                if space > 0:
+                    end = space
+            windows.append(text[:end].strip())
+            text = text[end:].strip()
+        return [window for window in windows if window]
+
+    def _chunk(self, text: str, chunk_tokens: int) -> List[str]:
+        ## Paragraphs first; paragraphs longer than a chunk are split on sentences,
+        ## and sentences still longer than a chunk (tables, long lists) are cut into windows
+        pieces = []
+        for paragraph in re.split(r"\n\s*\n|\n", text):
+            paragraph = paragraph.strip()
+            if not paragraph:
+                continue
+            if self.count_tokens(paragraph) <= chunk_tokens:
+                pieces.append(paragraph)
+                continue
+            for sentence in re.split(r"(?<=[.!?])\s+", paragraph):
+                if sentence.strip():
+                    pieces.extend(self._split_tokens(sentence.strip(), chunk_tokens))
+
+        chunks, current, current_tokens = [], [], 0
+        for piece in pieces:
+            n_tokens = self.count_tokens(piece)
+            if current and current_tokens + n_tokens > chunk_tokens:
+                chunks.append(' '.join(current))
+                current, current_tokens = [], 0
+            current.append(piece)
+            current_tokens += n_tokens
+        if current:
+            chunks.append(' '.join(current))
+        return chunks
+
+    def score(self, query: str) -> List[float]:
+        """BM25 score of every chunk for `query`."""
+        terms = self._tokenize(query or '')
+        scores = []
+        for tf, doc_len in zip(self._term_freqs, self._doc_lens):
+            s = 0.0
+            norm = self.K1 * (1 - self.B + self.B * doc_len / self._avg_doc_len) if self._avg_doc_len else self.K1
+            for term in terms:
+                freq = tf.get(term)
+                if freq:
+                    s += self._idf[term] * freq * (self.K1 + 1) / (freq + norm)
+            scores.append(s)
+        return scores
+
+    def search(self, query: str, top_k: int = 5, token_budget: int = 1500) -> List[str]:
+        """
+        Best `top_k` chunks for `query` whose total size fits in `token_budget`, in document order.
+        Without any matching term, the leading chunks of the document are returned.
+        A non-empty document always yields at least its best chunk, cut down to the budget if needed.
+        """
+        scores = self.score(query)
+        if any(scores):
+            ranked = sorted((i for i, s in enumerate(scores) if s > 0), key=lambda i: scores[i], reverse=True)
+        else:
+            ranked = range(len(self.chunks))
+
+        selected, used = [], 0
+        for i in ranked:
+            if len(selected) == top_k:
+                break
+            if used + self.chunk_n_tokens[i] > token_budget:
+                continue
+            selected.append(i)
+            used += self.chunk_n_tokens[i]
+        if not selected and self.chunks:
+            return self._split_tokens(self.chunks[next(iter(ranked))], max(1, token_budget))[:1]
+        return [self.chunks[i] for i in sorted(selected)]
+
+
+if __name__ == '__main__':
+    ## Benchmark: prompt tokens of one tool call returning the whole 10-K item vs. the top passages for a query
+    from src.report.agent.tool.data_context import ReportDataContext
+    import time
+
+    context = ReportDataContext.load('NVDA', 2025, 1)
+    count_tokens = get_token_counter()
+    for item, query in [('latest_filing_item1', 'main products and customers'),
+                        ('latest_filing_item1a', 'supply chain and export control risks'),
+                        ('latest_filing_item7', 'revenue growth drivers and gross margin')]:
+        text = getattr(context, item)
+        start = time.perf_counter()
+        index = BM25ChunkIndex(text, count_tokens=count_tokens)
+        built = time.perf_counter()
+        passages = index.search(query)
+        end = time.perf_counter()
+        print(f"[{item}] full: {count_tokens(text)} tokens, retrieved: {sum(map(count_tokens, passages))} tokens, "
+              f"index: {built - start:.3f} s, search: {(end - built) * 1000:.2f} ms")
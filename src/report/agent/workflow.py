@@ -4,6 +4,7 @@ from src.config import (
     LANGFUSE_PRIVATE_KEY,
     LANGFUSE_HOST
 )
+from src.config.config import REPORT_INCREMENTAL
 from src.report.agent import (
     State,
     BSOTeam,
@@ -13,7 +14,9 @@ from src.report.agent import (
     BDTeam,
     ReportTeamBase,
     AgentWorkflowUtils,
-    HumanTools
+    HumanTools,
+    ReportDataContext,
+    SectionStore
 )
 from src.report.llm import OPENAI_CALLER
 from langgraph.graph import StateGraph, MessagesState, START, END
@@ -21,18 +24,23 @@ from langfuse.callback import CallbackHandler
 from PIL import Image as PILImage
 import io
 import json
+from typing import Dict, List, Optional, Tuple
 import asyncio
 import time
 
 class AgentWorkflow(AgentWorkflowUtils):
 
+    MAX_CONCURRENCY = 5 ## How many teams may run at once in `arun`
+
     def __init__(self,
                  ticker,
                  year,
-                 quarter):
+                 quarter,
+                 section_store: Optional[SectionStore] = None):
         self.ticker = ticker
         self.year = year
         self.quarter = quarter
+        self.section_store = section_store if section_store is not None else SectionStore()
 
         self.openai_llm = OPENAI_CALLER()._get_llm(model='gpt-4o')
         self.langfuse_handler = CallbackHandler(secret_key=LANGFUSE_PRIVATE_KEY,
@@ -40,67 +48,154 @@ class AgentWorkflow(AgentWorkflowUtils):
                                                 host=LANGFUSE_HOST
                                                 )
 
-        self.humantools = HumanTools(ticker, year, quarter)
+        ## Load the report data once and share it across all teams
+        self.data_context = ReportDataContext.load(ticker=ticker, year=year, quarter=quarter)
+
+        self.humantools = HumanTools(ticker, year, quarter, data_context=self.data_context)
 
         ## Define Agent Teams
-        self.bso_team = BSOTeam(ticker=ticker, year=year, quarter=quarter)
-        self.fvpd_team = FVPDTeam(ticker=ticker, year=year, quarter=quarter)
-        self.ru_team = RUTeam(ticker=ticker, year=year, quarter=quarter)
-        self.bd_team = BDTeam(ticker=ticker, year=year, quarter=quarter)
-        self.ca_team = CATeam(ticker=ticker, year=year, quarter=quarter)
+        self.bso_team = BSOTeam(ticker=ticker, year=year, quarter=quarter, data_context=self.data_context)
+        self.fvpd_team = FVPDTeam(ticker=ticker, year=year, quarter=quarter, data_context=self.data_context)
+        self.ru_team = RUTeam(ticker=ticker, year=year, quarter=quarter, data_context=self.data_context)
+        self.bd_team = BDTeam(ticker=ticker, year=year, quarter=quarter, data_context=self.data_context)
+        self.ca_team = CATeam(ticker=ticker, year=year, quarter=quarter, data_context=self.data_context)
         self.company = [self.bso_team, self.fvpd_team, self.ru_team, self.bd_team, self.ca_team]
 
 
-    def create_team(self, builder: StateGraph, team: ReportTeamBase):
+    def create_team(self, builder: StateGraph, team: ReportTeamBase, is_async: bool = False):
 
-        builder.add_node(team.TEAM_SUPERVISOR_NAME, team.team_supervisor_node)
-        builder.add_node(team.ASSISTANT_NAME, team.writer_node)
-        builder.add_node(team.EVALUATOR_NAME, team.evaluator_node)
+        builder.add_node(team.TEAM_SUPERVISOR_NAME, team.ateam_supervisor_node if is_async else team.team_supervisor_node)
+        builder.add_node(team.ASSISTANT_NAME, team.awriter_node if is_async else team.writer_node)
+        builder.add_node(team.EVALUATOR_NAME, team.aevaluator_node if is_async else team.evaluator_node)
         builder.add_edge(START, team.TEAM_SUPERVISOR_NAME)
         return builder
 
-    def run(self):
-
-        start = time.perf_counter()
-        company_builder = StateGraph(State)
-        for team in self.company:
-            company_builder = self.create_team(company_builder, team)
-        company_graph = company_builder.compile(cache=None)
+    def _get_initial_input(self):
+        return {"messages": [("user", f"Please write me an Investment report for {self.ticker} for year {self.year}")]}
 
-        end = time.perf_counter()
-        print(f"Elapsed: {end - start:.6f} s")
-
-        ## Drawing Images
-        buf = company_graph.get_graph().draw_mermaid_png()
-        img = PILImage.open(io.BytesIO(buf))
-        img.show()
-        team_msg = []
-        for s in company_graph.stream(
-                {"messages": [("user", f"Please write me an Investment report for {self.ticker} for year {self.year}")]},
-                config={"recursion_limit": 100, "callbacks": [self.langfuse_handler]}
-        ):
-            team_msg.append(s)
-            print(s)
-            print("---")
+    def _get_stream_config(self):
+        return {"recursion_limit": 100, "callbacks": [self.langfuse_handler]}
 
+    def _get_sections(self, team_msg, teams: Optional[List[ReportTeamBase]] = None):
         grouped_messages = self._group_messages_by_team(team_msg)
         output_dict = {}
-        for team in self.company:
+        for team in (self.company if teams is None else teams):
             temp_dict = {}
             temp_dict["section"] = self._get_last_msg_for_team(team_msg_dict=grouped_messages, team_name=team.TEAM_NAME, team_member=team.ASSISTANT_NAME).content
             output_dict[team.TEAM_NAME] = temp_dict
+        return output_dict
+
+    ## ---------------------------------------------------- Incremental regeneration ---------------------------------------------------- ##
+    def _plan_teams(self, incremental: bool) -> Tuple[List[ReportTeamBase], Dict[str, str], Dict[str, Tuple]]:
+        """
+        Split the teams into the ones to run and the ones whose inputs are unchanged since their stored section.
+        Fingerprinting loads every dataset a team reads, so it only happens in incremental mode;
+        otherwise the datasets stay lazy and nothing is stored.
+
+        Returns: (teams to run, {team name: reused section}, {team name: (section fingerprint, input fingerprints)})
+        """
+        reused, fingerprints = {}, {}
+        for team in self.company:
+            if not incremental:
+                fingerprints[team.TEAM_NAME] = (None, None)
+                continue
+            inputs = team.input_fingerprints()
+            fingerprint = team.section_fingerprint(inputs)
+            fingerprints[team.TEAM_NAME] = (fingerprint, inputs)
+            section = self.section_store.get(self.ticker, self.year, self.quarter, team.TEAM_NAME, fingerprint)
+            if section is not None:
+                reused[team.TEAM_NAME] = section
+        teams = [team for team in self.company if team.TEAM_NAME not in reused]
+        print(f"Reusing {sorted(reused)}, running {[team.TEAM_NAME for team in teams]}")
+        return teams, reused, fingerprints
+
+    def _merge_sections(self, written: Dict[str, Dict], reused: Dict[str, str], fingerprints: Dict[str, Tuple]) -> Dict[str, Dict]:
+        """Store the newly written sections and merge them with the reused ones, in team order."""
+        for team_name, section in written.items():
+            fingerprint, inputs = fingerprints[team_name]
+            if fingerprint is not None:
+                self.section_store.put(self.ticker, self.year, self.quarter, team_name,
+                                       fingerprint=fingerprint, section=section["section"], inputs=inputs)
+        return {
+            team.TEAM_NAME: written[team.TEAM_NAME] if team.TEAM_NAME in written else {"section": reused[team.TEAM_NAME]}
+            for team in self.company
+        }
+
+    def run(self, incremental: bool = REPORT_INCREMENTAL):
+        """
+        incremental: reuse the stored section of every team whose input data is unchanged, only the other teams run.
+        """
+        teams, reused, fingerprints = self._plan_teams(incremental)
 
+        team_msg = []
+        if teams:
+            start = time.perf_counter()
+            company_builder = StateGraph(State)
+            for team in teams:
+                company_builder = self.create_team(company_builder, team)
+            company_graph = company_builder.compile(cache=None)
+
+            end = time.perf_counter()
+            print(f"Elapsed: {end - start:.6f} s")
+
+            ## Drawing Images
+            buf = company_graph.get_graph().draw_mermaid_png()
+            img = PILImage.open(io.BytesIO(buf))
+            img.show()
+            for s in company_graph.stream(
+                    self._get_initial_input(),
+                    config=self._get_stream_config()
+            ):
+                team_msg.append(s)
+                print(s)
+                print("---")
+
+        output_dict = self._merge_sections(self._get_sections(team_msg, teams), reused, fingerprints)
         output_dict["comp_and_competitors_infos"] = asyncio.run(self.humantools.main())
         # with open("output.json", "w") as outfile:
         #     json.dump(output_dict, outfile)
         return output_dict
 
+    async def _arun_team(self, team: ReportTeamBase, semaphore: asyncio.Semaphore):
+        """Run one team in its own async graph, so teams do not wait on each other's supersteps."""
+        async with semaphore:
+            team_graph = self.create_team(StateGraph(State), team, is_async=True).compile(cache=None)
+            team_msg = []
+            async for s in team_graph.astream(self._get_initial_input(), config=self._get_stream_config()):
+                team_msg.append(s)
+                print(s)
+                print("---")
+            return team_msg
+
+    async def arun(self, max_concurrency: Optional[int] = None, incremental: bool = REPORT_INCREMENTAL):
+        """
+        Async execution mode: every team and the competitor data fetch run concurrently,
+        so the report takes about as long as its slowest team.
+
+        max_concurrency: maximum number of teams running at once, defaults to MAX_CONCURRENCY.
+        incremental: reuse the stored section of every team whose input data is unchanged, only the other teams run.
+        """
+        teams, reused, fingerprints = await asyncio.to_thread(self._plan_teams, incremental)
+        semaphore = asyncio.Semaphore(max_concurrency or self.MAX_CONCURRENCY)
+        teams_msg, comp_and_competitors_infos = await asyncio.gather(
+            asyncio.gather(*[self._arun_team(team, semaphore) for team in teams]),
+            self.humantools.main()
+        )
+
+        output_dict = self._merge_sections(self._get_sections([s for team_msg in teams_msg for s in team_msg], teams),
+                                           reused, fingerprints)
+        output_dict["comp_and_competitors_infos"] = comp_and_competitors_infos
+        return output_dict
+
 
 
 if __name__ == '__main__':
     start = time.perf_counter()
     agent = AgentWorkflow('NVDA', 2025, 1)
     agent.run()
+    # asyncio.run(agent.arun())
 
     end = time.perf_counter()
-    print(f"Elapsed: {end - start:.6f} s")
\ No newline at end of file
+    print(f"Elapsed: {end - start:.6f} s")
+    if agent.openai_llm.cache is not None:
+        print(f"LLM cache: {agent.openai_llm.cache.stats()}")
\ No newline at end of file
@@ -1,43 +1,41 @@
 import functools
+import inspect
 from typing import Dict, List, Tuple, Literal, Union, Callable
 from langgraph.types import Command
 
 class AgentDecorator:
 
     @staticmethod
-    def inject_literal_annotations(cls):
-
-        # 1) team_supervisor_node():
-        orig_sup = cls.team_supervisor_node
-
-        @functools.wraps(orig_sup)
-        def team_supervisor_node(self, state):
-            return orig_sup(self, state)
-
-        team_supervisor_node.__annotations__ = orig_sup.__annotations__.copy()
-        team_supervisor_node.__annotations__['return'] = Command[Literal[cls.ASSISTANT_NAME, "__end__"]]
-        cls.team_supervisor_node = team_supervisor_node
-
-
-        # 2) evaluator_node():
-        orig_eval = cls.evaluator_node
+    def _with_return_annotation(node: Callable, return_annotation) -> Callable:
+        """Wrap a (sync or async) node so LangGraph can read its possible destinations from the return annotation."""
+        if inspect.iscoroutinefunction(node):
+            @functools.wraps(node)
+            async def wrapper(self, state):
+                return await node(self, state)
+        else:
+            @functools.wraps(node)
+            def wrapper(self, state):
+                return node(self, state)
+
+        wrapper.__annotations__ = node.__annotations__.copy()
+        wrapper.__annotations__['return'] = return_annotation
+        return wrapper
 
-        @functools.wraps(orig_eval)
-        def evaluator_node(self, state):
-            return orig_eval(self, state)
-
-        evaluator_node.__annotations__ = orig_eval.__annotations__.copy()
-        evaluator_node.__annotations__['return'] = Command[Literal[cls.ASSISTANT_NAME]]
-        cls.evaluator_node = evaluator_node
-
-        # 3) writer_node():
-        orig_writer = cls.writer_node
-
-        @functools.wraps(orig_writer)
-        def writer_node(self, state):
-            return orig_writer(self, state)
+    @staticmethod
+    def inject_literal_annotations(cls):
 
-        writer_node.__annotations__ = orig_writer.__annotations__.copy()
-        writer_node.__annotations__['return'] = Command[Literal[cls.EVALUATOR_NAME, cls.TEAM_SUPERVISOR_NAME]]
-        cls.writer_node = writer_node
-        return cls
\ No newline at end of file
+        # 1) team_supervisor_node() / ateam_supervisor_node():
+        sup_return = Command[Literal[cls.ASSISTANT_NAME, "__end__"]]
+        cls.team_supervisor_node = AgentDecorator._with_return_annotation(cls.team_supervisor_node, sup_return)
+        cls.ateam_supervisor_node = AgentDecorator._with_return_annotation(cls.ateam_supervisor_node, sup_return)
+
+        # 2) evaluator_node() / aevaluator_node():
+        eval_return = Command[Literal[cls.ASSISTANT_NAME]]
+        cls.evaluator_node = AgentDecorator._with_return_annotation(cls.evaluator_node, eval_return)
+        cls.aevaluator_node = AgentDecorator._with_return_annotation(cls.aevaluator_node, eval_return)
+
+        # 3) writer_node() / awriter_node():
+        writer_return = Command[Literal[cls.EVALUATOR_NAME, cls.TEAM_SUPERVISOR_NAME]]
+        cls.writer_node = AgentDecorator._with_return_annotation(cls.writer_node, writer_return)
+        cls.awriter_node = AgentDecorator._with_return_annotation(cls.awriter_node, writer_return)
+        return cls
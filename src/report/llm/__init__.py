@@ -1,5 +1,10 @@
+from .llm_cache import *
+from .llm_client import *
 from .llm_caller import *
 
 __all__ = [
-    'OPENAI_CALLER'
+    'OPENAI_CALLER',
+    'SQLiteLLMCache',
+    'get_llm_cache',
+    'LLMClientRegistry'
 ]
\ No newline at end of file
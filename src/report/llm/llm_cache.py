@@ -0,0 +1,161 @@
+from src.config.config import LLM_CACHE, LLM_CACHE_PATH, LLM_CACHE_MAX_ENTRIES
+from langchain_core.caches import BaseCache, RETURN_VAL_TYPE
+from langchain_core.load import dumps, loads
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+
+
+class SQLiteLLMCache(BaseCache):
+    """
+    On-disk LLM response cache for chat models, stored in a single SQLite file.
+
+    Entries are keyed on two hashes:
+    - llm_string: model name and invocation parameters, including the bound tool schemas and response format
+    - prompt: the serialized messages, normalised so that run-specific message ids and response metadata do not
+      change the key
+
+    The least recently used entries are evicted once the cache holds more than `max_entries` rows.
+    """
+
+    ## Message fields that differ between two runs of the same conversation
+    VOLATILE_FIELDS = ('id', 'response_metadata', 'usage_metadata')
+
+    def __init__(self,
+                 path: Union[str, Path] = LLM_CACHE_PATH,
+                 max_entries: Optional[int] = LLM_CACHE_MAX_ENTRIES):
+        """
+        Parameters:
+        path (str | Path): SQLite database file.
+        max_entries (int | None): Keep at most this many responses (least recently used are evicted). None means no limit.
+        """
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS llm_cache (
+                llm_hash    TEXT NOT NULL,
+                prompt_hash TEXT NOT NULL,
+                response    TEXT NOT NULL,
+                created_at  REAL NOT NULL,
+                last_access REAL NOT NULL,
+                PRIMARY KEY (llm_hash, prompt_hash)
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_llm_cache_last_access ON llm_cache (last_access)")
+        self._conn.commit()
+
+    ## ---------------------------------------------------- Keys ---------------------------------------------------- ##
+    @staticmethod
+    def _hash(text: str) -> str:
+        return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+    @classmethod
+    def _strip_volatile(cls, obj: Any) -> Any:
+        if isinstance(obj, dict):
+            if 'lc' in obj and isinstance(obj.get('kwargs'), dict):
+                obj = {**obj, 'kwargs': {k: v for k, v in obj['kwargs'].items() if k not in cls.VOLATILE_FIELDS}}
+            return {k: cls._strip_volatile(v) for k, v in obj.items()}
+        if isinstance(obj, list):
+            return [cls._strip_volatile(v) for v in obj]
+        return obj
+
+    @classmethod
+    def normalize_prompt(cls, prompt: str) -> str:
+        """Canonical form of a serialized chat prompt: volatile message fields dropped, keys sorted."""
+        try:
+            return json.dumps(cls._strip_volatile(json.loads(prompt)), sort_keys=True)
+        except ValueError:
+            return prompt
+
+    def _key(self, prompt: str, llm_string: str):
+        return self._hash(llm_string), self._hash(self.normalize_prompt(prompt))
+
+    ## ---------------------------------------------------- BaseCache ---------------------------------------------------- ##
+    def lookup(self, prompt: str, llm_string: str) -> Optional[RETURN_VAL_TYPE]:
+        llm_hash, prompt_hash = self._key(prompt, llm_string)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response FROM llm_cache WHERE llm_hash = ? AND prompt_hash = ?",
+                (llm_hash, prompt_hash)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._conn.execute(
+                "UPDATE llm_cache SET last_access = ? WHERE llm_hash = ? AND prompt_hash = ?",
+                (time.time(), llm_hash, prompt_hash)
+            )
+            self._conn.commit()
+        try:
+            return [loads(generation) for generation in json.loads(row[0])]
+        except Exception:
+            return None
+
+    def update(self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE) -> None:
+        llm_hash, prompt_hash = self._key(prompt, llm_string)
+        response = json.dumps([dumps(generation) for generation in return_val])
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (llm_hash, prompt_hash, response, created_at, last_access) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (llm_hash, prompt_hash, response, now, now)
+            )
+            if self.max_entries is not None:
+                self._conn.execute(
+                    "DELETE FROM llm_cache WHERE rowid IN ("
+                    "SELECT rowid FROM llm_cache ORDER BY last_access DESC LIMIT -1 OFFSET ?)",
+                    (self.max_entries,)
+                )
+            self._conn.commit()
+
+    def clear(self, **kwargs: Any) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM llm_cache")
+            self._conn.commit()
+        self.hits = 0
+        self.misses = 0
+
+    ## ---------------------------------------------------- Metrics ---------------------------------------------------- ##
+    def n_entries(self) -> int:
+        ## Not __len__: an empty cache would be falsy, and langchain skips falsy model caches
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0]
+
+    def stats(self) -> Dict[str, Union[int, float]]:
+        """Hit / miss counters since this cache object was created, plus the number of stored entries."""
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'entries': self.n_entries(),
+        }
+
+
+_LLM_CACHE: Optional[SQLiteLLMCache] = None
+_LLM_CACHE_LOCK = threading.Lock()
+
+def get_llm_cache() -> Optional[SQLiteLLMCache]:
+    """Process-wide LLM cache, or None when caching is disabled (LLM_CACHE env var)."""
+    global _LLM_CACHE
+    if not LLM_CACHE:
+        return None
+    with _LLM_CACHE_LOCK:
+        if _LLM_CACHE is None:
+            _LLM_CACHE = SQLiteLLMCache()
+        return _LLM_CACHE
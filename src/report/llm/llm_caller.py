@@ -1,7 +1,18 @@
-from src.config import OPENAI_API_KEY
 from src.abstractions import LlmABC
-from langchain_openai import ChatOpenAI
+from src.report.llm.llm_cache import get_llm_cache
+from src.report.llm.llm_client import LLMClientRegistry
+from langchain_core.caches import BaseCache
+from typing import Optional
 
 class OPENAI_CALLER(LlmABC):
+    def __init__(self, cache: Optional[BaseCache] = None):
+        """
+        Parameters:
+        cache (BaseCache | None): Response cache for the models created by this caller.
+                                  Defaults to the process-wide cache, enabled with the LLM_CACHE env var.
+        """
+        self.cache = cache if cache is not None else get_llm_cache()
+
     def _get_llm(self, model: str='gpt-4o'):
-        return ChatOpenAI(model=model, openai_api_key=OPENAI_API_KEY)
\ No newline at end of file
+        ## Shared per model across the process, so all teams reuse one connection pool
+        return LLMClientRegistry.get_chat_openai(model=model, cache=self.cache)
\ No newline at end of file
@@ -0,0 +1,113 @@
+from src.config.config import (
+    OPENAI_API_KEY,
+    LLM_HTTP2,
+    LLM_MAX_CONNECTIONS,
+    LLM_MAX_KEEPALIVE_CONNECTIONS,
+    LLM_KEEPALIVE_EXPIRY,
+    LLM_TIMEOUT,
+    LLM_RATE_LIMIT
+)
+from langchain_core.caches import BaseCache
+from langchain_core.rate_limiters import InMemoryRateLimiter
+from langchain_openai import ChatOpenAI
+from typing import Dict, Optional, Tuple
+import importlib.util
+import asyncio
+import threading
+import weakref
+import httpx
+
+
+class _PerLoopAsyncTransport(httpx.AsyncBaseTransport):
+    """
+    Async transport keeping one connection pool per event loop.
+    httpx connections are bound to the loop that opened them, so a single pool can not be reused across `asyncio.run` calls.
+    """
+
+    def __init__(self, **transport_kwargs):
+        self._transport_kwargs = transport_kwargs
+        self._transports = weakref.WeakKeyDictionary()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        loop = asyncio.get_running_loop()
+        transport = self._transports.get(loop)
+        if transport is None:
+            transport = self._transports[loop] = httpx.AsyncHTTPTransport(**self._transport_kwargs)
+        return await transport.handle_async_request(request)
+
+    async def aclose(self):
+        transport = self._transports.pop(asyncio.get_running_loop(), None)
+        if transport is not None:
+            await transport.aclose()
+
+
+class LLMClientRegistry:
+    """
+    Process-wide registry of chat models.
+
+    All models share one pooled sync and one pooled async HTTP client (HTTP/2 when the `h2` package is installed),
+    and each (model, cache) pair is built once, so every team reuses the same TLS connections.
+    Every model also shares one request rate limiter (LLM_RATE_LIMIT), so concurrent reports stay under the API quota.
+    Pool size, keep-alive and timeout come from the LLM_* settings in src.config.
+    """
+
+    _lock = threading.Lock()
+    _http_client: Optional[httpx.Client] = None
+    _http_async_client: Optional[httpx.AsyncClient] = None
+    _llms: Dict[Tuple[str, Optional[BaseCache]], ChatOpenAI] = {}
+    _rate_limiter: Optional[InMemoryRateLimiter] = (
+        InMemoryRateLimiter(requests_per_second=LLM_RATE_LIMIT) if LLM_RATE_LIMIT > 0 else None
+    )
+
+    @staticmethod
+    def _transport_kwargs() -> dict:
+        return {
+            'http2': LLM_HTTP2 and importlib.util.find_spec('h2') is not None,
+            'limits': httpx.Limits(max_connections=LLM_MAX_CONNECTIONS,
+                                   max_keepalive_connections=LLM_MAX_KEEPALIVE_CONNECTIONS,
+                                   keepalive_expiry=LLM_KEEPALIVE_EXPIRY),
+        }
+
+    @classmethod
+    def get_http_clients(cls) -> Tuple[httpx.Client, httpx.AsyncClient]:
+        """The shared (sync, async) HTTP clients, created on first use."""
+        with cls._lock:
+            if cls._http_client is None:
+                cls._http_client = httpx.Client(transport=httpx.HTTPTransport(**cls._transport_kwargs()),
+                                                timeout=LLM_TIMEOUT)
+                cls._http_async_client = httpx.AsyncClient(transport=_PerLoopAsyncTransport(**cls._transport_kwargs()),
+                                                           timeout=LLM_TIMEOUT)
+            return cls._http_client, cls._http_async_client
+
+    @classmethod
+    def set_rate_limit(cls, requests_per_second: float):
+        """Replace the shared rate limiter (0 for no limit). Models built before keep their limiter, so call it first."""
+        with cls._lock:
+            cls._rate_limiter = InMemoryRateLimiter(requests_per_second=requests_per_second) if requests_per_second > 0 else None
+            cls._llms = {}
+
+    @classmethod
+    def get_chat_openai(cls, model: str, cache: Optional[BaseCache] = None) -> ChatOpenAI:
+        """Shared ChatOpenAI for `model`, using the pooled HTTP clients."""
+        http_client, http_async_client = cls.get_http_clients()
+        with cls._lock:
+            key = (model, cache)
+            if key not in cls._llms:
+                cls._llms[key] = ChatOpenAI(model=model,
+                                            openai_api_key=OPENAI_API_KEY,
+                                            cache=cache,
+                                            rate_limiter=cls._rate_limiter,
+                                            timeout=LLM_TIMEOUT,
+                                            http_client=http_client,
+                                            http_async_client=http_async_client)
+            return cls._llms[key]
+
+    @classmethod
+    def close(cls):
+        """Close the shared sync client and forget every model (async pools are released with their event loop)."""
+        with cls._lock:
+            if cls._http_client is not None:
+                cls._http_client.close()
+            cls._http_client = None
+            cls._http_async_client = None
+            cls._llms = {}
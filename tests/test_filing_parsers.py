@@ -0,0 +1,38 @@
+"""10-K item splitter on the committed filing corpus: html.parser output is pinned, every other installed backend must match it."""
+from src.fdata_extractors.utils import extract_items, get_html_parser, HTML_PARSER, HTML_PARSERS
+from src.fdata_extractors.filing_benchmark import item_boundaries
+
+from pathlib import Path
+import json
+import pytest
+
+CORPUS_DIR = Path(__file__).parent / 'fixtures' / 'filings'
+FILINGS = sorted(CORPUS_DIR.glob('*.htm'))
+REFERENCE = 'html.parser'
+
+
+def expected_boundaries() -> dict:
+    with open(CORPUS_DIR / 'expected_boundaries.json', 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def boundaries(filing: Path, parser: str) -> dict:
+    items = extract_items(filing.read_text(encoding='utf-8'), parser=parser)
+    return {key: list(bounds) for key, bounds in item_boundaries(items).items()}
+
+
+def test_default_parser_is_reference():
+    assert HTML_PARSER == REFERENCE
+
+
+@pytest.mark.parametrize('filing', FILINGS, ids=lambda p: p.name)
+def test_reference_output_is_unchanged(filing):
+    assert boundaries(filing, REFERENCE) == expected_boundaries()[filing.name]
+
+
+@pytest.mark.parametrize('parser', [p for p in HTML_PARSERS if p != REFERENCE])
+@pytest.mark.parametrize('filing', FILINGS, ids=lambda p: p.name)
+def test_backend_matches_reference(filing, parser):
+    if get_html_parser(parser) != parser:
+        pytest.skip(f"{parser} is not installed")
+    assert boundaries(filing, parser) == boundaries(filing, REFERENCE)
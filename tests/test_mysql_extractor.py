@@ -0,0 +1,64 @@
+"""MySQLExtractor competitor queries, run against SQLite through the injectable engine and table."""
+from src.fdata_extractors import MySQLExtractor
+
+from sqlalchemy import create_engine, text
+import pandas as pd
+import pytest
+
+TABLE = 'competitors'
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'competitors.db'}")
+    rows = [
+        ('NVDA', 'Intel', 'INTC', 'CPU', 3),
+        ('NVDA', 'AMD', 'AMD', 'GPU', 1),
+        ('NVDA', 'Qualcomm', 'QCOM', 'SoC', 4),
+        ('NVDA', 'Broadcom', 'AVGO', 'ASIC', 2),
+        ('AMD', 'Intel', 'INTC', 'CPU', 2),
+        ('AMD', 'NVIDIA', 'NVDA', 'GPU', 1),
+    ]
+    pd.DataFrame(rows, columns=['company_ticker', 'competitor_name', 'competitor_ticker', 'competed_product', 'competitor_rank']) \
+        .to_sql(TABLE, engine, index=False)
+    yield engine
+    engine.dispose()
+
+
+def test_get_competitors_orders_by_rank_and_limits(engine):
+    df = MySQLExtractor('NVDA', engine=engine, table=TABLE)._get_competitors(competitors_limit=3)
+    assert df['competitor_rank'].tolist() == [1, 2, 3]
+    assert df['competitor_ticker'].tolist() == ['AMD', 'AVGO', 'INTC']
+
+
+def test_get_competitors_unknown_ticker_is_empty(engine):
+    df = MySQLExtractor('MSFT', engine=engine, table=TABLE)._get_competitors(competitors_limit=3)
+    assert df.empty
+    assert 'competitor_name' in df.columns
+
+
+def test_get_competitors_bulk_groups_per_ticker(engine):
+    competitors = MySQLExtractor.get_competitors_bulk(['NVDA', 'MSFT', 'AMD', 'NVDA'], competitors_limit=3,
+                                                      engine=engine, table=TABLE)
+    assert list(competitors) == ['NVDA', 'MSFT', 'AMD']
+    assert competitors['NVDA']['competitor_rank'].tolist() == [1, 2, 3]
+    assert competitors['AMD']['competitor_ticker'].tolist() == ['NVDA', 'INTC']
+    assert competitors['MSFT'].empty
+    assert list(competitors['MSFT'].columns) == list(competitors['NVDA'].columns)
+
+
+def test_get_competitors_bulk_matches_single_lookups(engine):
+    competitors = MySQLExtractor.get_competitors_bulk(['NVDA', 'AMD'], competitors_limit=2, engine=engine, table=TABLE)
+    for ticker, df in competitors.items():
+        single = MySQLExtractor(ticker, engine=engine, table=TABLE)._get_competitors(competitors_limit=2)
+        pd.testing.assert_frame_equal(df, single)
+
+
+def test_create_index_is_idempotent_and_used(engine):
+    MySQLExtractor.create_index(engine=engine, table=TABLE)
+    MySQLExtractor.create_index(engine=engine, table=TABLE)
+    with engine.connect() as conn:
+        plan = conn.execute(text(
+            f"EXPLAIN QUERY PLAN SELECT * FROM {TABLE} WHERE company_ticker = 'NVDA' ORDER BY competitor_rank LIMIT 3"
+        )).fetchall()
+    assert any(MySQLExtractor.COMPETITORS_INDEX in str(row) for row in plan)
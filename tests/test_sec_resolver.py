@@ -0,0 +1,72 @@
+"""SecFilingResolver on the local EDGAR fixtures in tests/fixtures/sec, served over HTTP as data.sec.gov / www.sec.gov."""
+from src.fdata_extractors.sec_client import SecClient
+from src.fdata_extractors.sec_resolver import SecFilingResolver, build_cik_map, resolve_filings
+
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+import json
+import threading
+import pytest
+
+FIXTURES_DIR = Path(__file__).parent / 'fixtures' / 'sec'
+
+
+def load_fixture(relative_path: str) -> dict:
+    with open(FIXTURES_DIR / relative_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+class QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture(scope='module')
+def fixture_url():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), partial(QuietHandler, directory=str(FIXTURES_DIR)))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def resolver(fixture_url, tmp_path):
+    return SecFilingResolver(client=SecClient(cache_dir=tmp_path), base_url=fixture_url, data_url=fixture_url)
+
+
+def test_build_cik_map():
+    assert build_cik_map(load_fixture('files/company_tickers.json')) == {'NVDA': 1045810, 'AMD': 2488, 'INTC': 50863}
+
+
+def test_resolve_filings_matches_form_exactly_in_latest_year_newest_first():
+    filings = resolve_filings(load_fixture('submissions/CIK0001045810.json'), form_type='10-K', base_url='https://www.sec.gov')
+    ## 10-K/A, NT 10-K and 10-Q are other forms, the 2024 10-K is an older year, the 10-K without a document is skipped
+    assert [(f.filing_date, f.accession) for f in filings] == [
+        ('2025-03-14', '0001045810-25-000030'),
+        ('2025-02-26', '0001045810-25-000023'),
+    ]
+    assert all(f.form == '10-K' and f.cik == 1045810 for f in filings)
+    assert filings[1].url == 'https://www.sec.gov/Archives/edgar/data/1045810/000104581025000023/nvda-20250126.htm'
+
+
+def test_resolve_filings_other_form_and_no_match():
+    submissions = load_fixture('submissions/CIK0001045810.json')
+    assert [f.accession for f in resolve_filings(submissions, form_type='10-K/A')] == ['0001045810-25-000101']
+    assert resolve_filings(submissions, form_type='8-K') == []
+    assert resolve_filings({'cik': '1045810', 'filings': {'recent': {}}}) == []
+
+
+def test_resolver_latest_filings(resolver, fixture_url):
+    filings = resolver.latest_filings('nvda')
+    assert [f.filing_date for f in filings] == ['2025-03-14', '2025-02-26']
+    assert filings[0].url.startswith(f"{fixture_url}/Archives/edgar/data/1045810/")
+
+
+def test_resolver_get_cik(resolver):
+    assert resolver.get_cik('AMD') == 2488
+    assert resolver.get_cik('1045810') == 1045810
+    with pytest.raises(ValueError):
+        resolver.get_cik('UNKNOWN')
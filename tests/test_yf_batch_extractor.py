@@ -0,0 +1,92 @@
+"""Batched competitor data (one quote request + one bulk download) against the per-ticker info + history path, on a mocked Yahoo payload."""
+from src.fdata_extractors import YFinanceAnalyzer
+from src.fdata_extractors.yfinance_extractors import yf_batch_extractor
+from src.fdata_extractors.yfinance_extractors.yf_cache import YFinanceCache
+from src.report.agent.tool import human_tools, HumanTools, ReportDataContext
+
+from yfinance.scrapers.quote import Quote
+import asyncio
+import pandas as pd
+import yfinance as yf
+import pytest
+
+DATES = pd.date_range('2024-06-03', periods=5, freq='B', tz='America/New_York')
+
+## Raw JSON as Yahoo serves it (formatted=false): quoteSummary modules read by `info`, and the v7 quote
+QUOTE_SUMMARY = {
+    'INTC': {
+        'financialData': {'currentPrice': 31.25},
+        'summaryDetail': {'dividendYield': 0.016, 'trailingPE': 32.1, 'marketCap': 133_000_000_000},
+        'defaultKeyStatistics': {'bookValue': 24.5},
+    },
+    'AMD': {
+        'financialData': {'currentPrice': 160.4},
+        'summaryDetail': {'trailingPE': 240.0, 'marketCap': 259_000_000_000},
+        'defaultKeyStatistics': {'bookValue': 34.6},
+    },
+}
+QUOTES = {
+    'INTC': {'regularMarketPrice': 31.25, 'dividendYield': 1.6, 'trailingPE': 32.1, 'bookValue': 24.5, 'marketCap': 133_000_000_000},
+    'AMD': {'regularMarketPrice': 160.4, 'trailingPE': 240.0, 'bookValue': 34.6, 'marketCap': 259_000_000_000},
+}
+## Raw and dividend-adjusted closes, so a path mixing the two shows a different 1y range
+CLOSES = {
+    'INTC': ([30.0, 31.0, 29.5, 32.0, 31.25], [29.7, 30.7, 29.2, 31.7, 31.25]),
+    'AMD': ([150.0, 158.0, 149.0, 162.0, 160.4], [150.0, 158.0, 149.0, 162.0, 160.4]),
+}
+
+
+def closes(symbol: str, auto_adjust: bool) -> pd.Series:
+    raw, adjusted = CLOSES[symbol]
+    return pd.Series(adjusted if auto_adjust else raw, index=DATES, name='Close')
+
+
+class FakeQuoteTicker:
+    def __init__(self, symbols):
+        self.symbols = symbols
+
+    @property
+    def quotes(self):
+        return {s: dict(QUOTES[s]) for s in self.symbols}
+
+
+def fake_download(tickers, period='1mo', interval='1d', group_by='column', auto_adjust=True, progress=True):
+    frame = pd.concat({t: closes(t, auto_adjust) for t in tickers}, axis=1)
+    frame.columns = pd.MultiIndex.from_product([['Close'], frame.columns])
+    return frame
+
+
+def fake_history(self, period='1mo', interval='1d', auto_adjust=True, **kwargs):
+    return closes(self.ticker, auto_adjust).to_frame()
+
+
+@pytest.fixture
+def tools(monkeypatch, tmp_path):
+    ## Batched path
+    monkeypatch.setattr(yf_batch_extractor.yahooquery, 'Ticker', FakeQuoteTicker)
+    monkeypatch.setattr(yf_batch_extractor.yf, 'download', fake_download)
+    ## Per-ticker path: yfinance builds `info` from the mocked JSON itself
+    monkeypatch.setattr(Quote, '_fetch', lambda self, modules: {'quoteSummary': {'result': [dict(QUOTE_SUMMARY[self._symbol])]}})
+    monkeypatch.setattr(Quote, '_fetch_additional_info',
+                        lambda self: {'quoteResponse': {'result': [{'symbol': self._symbol, **QUOTES[self._symbol]}]}})
+    monkeypatch.setattr(Quote, '_fetch_complementary', lambda self: None)
+    monkeypatch.setattr(yf.Ticker, 'history', fake_history)
+    monkeypatch.setattr(human_tools, 'YFinanceAnalyzer', lambda t: YFinanceAnalyzer(t, cache=YFinanceCache(tmp_path)))
+    ## Fixed estimate price
+    monkeypatch.setattr(human_tools.random, 'uniform', lambda a, b: 1.0)
+    return HumanTools('NVDA', 2025, 1, data_context=ReportDataContext.load('NVDA', 2025, 1))
+
+
+def test_batched_matches_per_ticker(tools):
+    tickers = ['INTC', 'AMD']
+    batched = asyncio.run(tools._fetch_batch_data(tickers))
+    per_ticker = [asyncio.run(tools._fetch_ticker_data(t)) for t in tickers]
+    assert batched == per_ticker
+
+
+def test_batched_units(tools):
+    rows = {row['ticker']: row for row in asyncio.run(tools._fetch_batch_data(['INTC', 'AMD']))}
+    assert rows['INTC']['dividends_yield'] == 1.6 # percent
+    assert rows['AMD']['dividends_yield'] is None
+    assert rows['INTC']['current_price'] == 31.25
+    assert rows['INTC']['one_year_price_range'] == '29.2-31.7' # adjusted closes